@@ -0,0 +1,390 @@
+"""
+Search Ads client module for the marketing tool
+네이버 검색광고 API(keywordstool) 호출을 위한 단일 클라이언트 - 서명, 요청, 응답 가공
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import time
+import urllib.parse
+import numpy as np
+import pandas as pd
+from cache import keyword_stats_cache, next_monthly_refresh
+from config import APIConfig, AppConfig, StorageConfig
+import jsoncodec
+from keyword_graph import keyword_graph, normalize_keyword
+from ratelimit import ads_limiter
+from runtime_config import runtime_config
+from scheduler import run_keyword_tasks
+from singleflight import inflight
+from transport import default_transport
+
+logger = logging.getLogger(__name__)
+
+def get_signature(method: str, uri: str, timestamp: str, access_key: str, secret_key: str) -> str:
+    """네이버 검색광고 API 인증을 위한 서명 생성"""
+    message = f"{timestamp}.{method}.{uri}"
+    signature = base64.b64encode(
+        hmac.new(secret_key.encode(), message.encode(), hashlib.sha256).digest()
+    ).decode()
+    return signature
+
+# 상세 통계 DataFrame 스키마 (parse_detailed_keyword_list 레코드와 같은 컬럼)
+KEYWORD_STATS_SCHEMA = {
+    "keyword": "string",
+    "monthly_pc_search": "int32",
+    "monthly_mobile_search": "int32",
+    "total_monthly_search": "int32",
+    "monthly_avg_pc_click": "int32",
+    "monthly_avg_mobile_click": "int32",
+    "total_monthly_avg_click": "int32",
+    "monthly_avg_pc_ctr": "float32",
+    "monthly_avg_mobile_ctr": "float32",
+    "total_monthly_avg_ctr": "float32",
+    "competition_index": "object",
+    "competition_level": pd.CategoricalDtype(['낮음', '보통', '높음', '알 수 없음']),
+    "pc_exposure": "int32",
+    "mobile_exposure": "int32",
+    "total_exposure": "int32",
+    "estimated_ads_count": "int32",
+    "source": "category",
+}
+
+# 경쟁도 문자열 → 광고수 계산용 수치
+_COMPETITION_LEVELS = {'낮음': 20.0, '보통': 50.0, '높음': 80.0}
+
+def _competition(value: str) -> tuple:
+    """경쟁도 값 하나를 (경쟁도 수준, 광고수 계산용 수치)로 변환"""
+    if value in _COMPETITION_LEVELS:
+        return value, _COMPETITION_LEVELS[value]
+    try:
+        numeric = float(value)
+    except (ValueError, TypeError):
+        return '알 수 없음', 50.0
+    if numeric <= 30:
+        return '낮음', numeric
+    if numeric <= 70:
+        return '보통', numeric
+    return '높음', numeric
+
+def _to_float(values: np.ndarray, below_ten: float = 5) -> np.ndarray:
+    """object 배열을 float64로 일괄 변환 ("< 10"은 below_ten, "-"·빈 값·숫자가 아닌 값은 NaN)"""
+    is_below_ten = values == "< 10"
+    cleaned = values.copy()
+    cleaned[is_below_ten | (values == "-") | (values == "") | (values == None)] = np.nan  # noqa: E711 (원소별 비교)
+    try:
+        numeric = cleaned.astype("float64")
+    except (ValueError, TypeError):
+        # 예상하지 못한 문자열이 섞인 경우에만 느린 경로 사용
+        numeric = np.asarray(pd.to_numeric(cleaned, errors="coerce"), dtype="float64").copy()
+    numeric[is_below_ten] = below_ten
+    return numeric
+
+def _stat_column(values: np.ndarray) -> np.ndarray:
+    """통계 컬럼 일괄 변환 ("< 10" → 5, 숫자가 아닌 값/"-"/빈 값 → 0, 소수는 버리고 음수는 0)"""
+    return np.nan_to_num(_to_float(values), nan=0.0).clip(min=0).astype("int32")
+
+def _ctr_column(values: np.ndarray) -> np.ndarray:
+    """클릭률 컬럼 일괄 변환 ("< 10"·숫자가 아닌 값/"-"/빈 값 → 0.0)"""
+    return np.nan_to_num(_to_float(values, below_ten=np.nan), nan=0.0)
+
+def _keyword_stats_columns(keyword_list: list) -> dict:
+    """keywordList를 상세 통계 컬럼 배열로 변환 (항목별 처리 대신 컬럼 단위 일괄 변환)
+
+    - 검색수/클릭수/광고 깊이: "< 10" → 5, "-"·빈 값·숫자가 아닌 값 → 0
+    - 클릭률: 숫자가 아닌 값 → 0.0, 합산 클릭률은 둘 중 하나라도 양수일 때만 평균
+    - 경쟁도: 고유값마다 한 번만 해석한 조회표로 변환 ('낮음'/'보통'/'높음' 또는 30/70 구간)
+
+    이전 항목별 파서와 결과가 다른 경우 (tests/test_keyword_parsing.py에서 확인):
+    - 정수가 아닌 숫자 문자열("1.5", "1e3")은 0 대신 소수점 이하를 버린 값(1, 1000)
+    - 음수 검색수/클릭수/광고 깊이는 그대로 두지 않고 0
+    - relKeyword가 null인 항목은 예외 대신 건너뜀
+    """
+    items = [item for item in keyword_list or [] if (item.get('relKeyword') or '').strip()]
+    
+    def column(field, default=None):
+        return np.array([item.get(field, default) for item in items], dtype=object)
+    
+    pc_search = _stat_column(column('monthlyPcQcCnt'))
+    mobile_search = _stat_column(column('monthlyMobileQcCnt'))
+    pc_click = _stat_column(column('monthlyAvePcClkCnt'))
+    mobile_click = _stat_column(column('monthlyAveMobileClkCnt'))
+    pc_ctr = _ctr_column(column('monthlyAvePcCtr'))
+    mobile_ctr = _ctr_column(column('monthlyAveMobileCtr'))
+    exposure = _stat_column(column('plAvgDepth'))  # PC/모바일 모두 광고 깊이를 노출 수 대용으로 사용
+    
+    competition_index = column('compIdx', 'N/A')
+    unique_values, inverse = np.unique(competition_index.astype(str), return_inverse=True)
+    table = [_competition(value) for value in unique_values.tolist()]
+    competition_level = np.array([level for level, _ in table], dtype=object)[inverse]
+    comp_numeric = np.array([numeric for _, numeric in table], dtype="float64")[inverse]
+    
+    return {
+        "keyword": np.array([item['relKeyword'].strip() for item in items], dtype=object),
+        "monthly_pc_search": pc_search,
+        "monthly_mobile_search": mobile_search,
+        "total_monthly_search": pc_search + mobile_search,
+        "monthly_avg_pc_click": pc_click,
+        "monthly_avg_mobile_click": mobile_click,
+        "total_monthly_avg_click": pc_click + mobile_click,
+        "monthly_avg_pc_ctr": pc_ctr,
+        "monthly_avg_mobile_ctr": mobile_ctr,
+        "total_monthly_avg_ctr": np.where((pc_ctr > 0) | (mobile_ctr > 0), (pc_ctr + mobile_ctr) / 2, 0.0),
+        "competition_index": competition_index,
+        "competition_level": competition_level,
+        "pc_exposure": exposure,
+        "mobile_exposure": exposure,
+        "total_exposure": exposure * 2,
+        "estimated_ads_count": np.maximum(1, (comp_numeric / 10).astype("int32")),
+        "source": np.full(len(items), "search_ads_api", dtype=object),
+    }
+
+def parse_keyword_list_frame(keyword_list: list) -> pd.DataFrame:
+    """keywordstool 응답의 keywordList를 타입이 지정된 상세 통계 DataFrame으로 변환"""
+    columns = _keyword_stats_columns(keyword_list)
+    typed = {}
+    for name, dtype in KEYWORD_STATS_SCHEMA.items():
+        if dtype in ("int32", "float32"):
+            typed[name] = columns[name].astype(dtype, copy=False)
+        else:
+            # 생성자의 문자열 타입 추론을 피하기 위해 Series로 직접 지정
+            typed[name] = pd.Series(columns[name], dtype=dtype)
+    return pd.DataFrame(typed, copy=False)
+
+def parse_detailed_keyword_list(keyword_list: list) -> list:
+    """keywordstool 응답의 keywordList를 상세 통계 딕셔너리 리스트로 변환"""
+    columns = _keyword_stats_columns(keyword_list)
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*(values.tolist() for values in columns.values()))]
+
+def to_related_keyword(detail: dict) -> dict:
+    """상세 통계 레코드를 연관 키워드 레코드로 변환 (연관 키워드 화면용 요약)"""
+    return {
+        'keyword': detail['keyword'],
+        'monthly_pc_qc': detail['monthly_pc_search'],
+        'monthly_mobile_qc': detail['monthly_mobile_search'],
+        'competition': detail['competition_index'],
+        'source': 'ads_api'
+    }
+
+class SearchAdsClient:
+    """네이버 검색광고 API 클라이언트
+
+    모든 검색광고 호출은 서명 → 공용 전송 계층(keep-alive 연결 풀, 재시도) →
+    속도 제한/일일 한도 → 동일 요청 병합의 한 경로를 거치고,
+    응답의 keywordList는 parse_detailed_keyword_list 한 곳에서 가공한다.
+    인증 정보는 호출 시점의 APIConfig 값을 사용한다.
+    """
+    
+    def __init__(self, transport=None, limiter=None):
+        self.transport = transport or default_transport
+        self.limiter = limiter or ads_limiter
+    
+    @property
+    def has_credentials(self) -> bool:
+        """검색광고 API 인증 정보가 모두 설정되어 있는지 여부"""
+        return all([APIConfig.ACCESS_LICENSE, APIConfig.SECRET_KEY, APIConfig.CUSTOMER_ID])
+    
+    def build_request(self, path: str, params: dict) -> tuple:
+        """서명된 GET 요청의 (URL, 헤더) 생성"""
+        # 타임스탬프 생성
+        timestamp = str(int(time.time() * 1000))
+        
+        # 서명 생성
+        signature = get_signature("GET", path, timestamp, APIConfig.ACCESS_LICENSE, APIConfig.SECRET_KEY)
+        
+        # 헤더 설정
+        headers = {
+            "X-Timestamp": timestamp,
+            "X-API-KEY": APIConfig.ACCESS_LICENSE,
+            "X-Customer": APIConfig.CUSTOMER_ID,
+            "X-Signature": signature,
+            "Content-Type": "application/json"
+        }
+        
+        # GET 방식으로 쿼리 파라미터 전송
+        url = f"{APIConfig.NAVER_ADS_API_BASE_URL}{path}?{urllib.parse.urlencode(params)}"
+        return url, headers
+    
+    @staticmethod
+    def keywordstool_params(hint_keywords: str) -> dict:
+        """keywordstool 쿼리 파라미터"""
+        return {'hintKeywords': hint_keywords, 'showDetail': '1'}
+    
+    def get(self, path: str, params: dict) -> dict:
+        """서명된 GET 요청을 보내고 JSON 응답을 반환 - 오류는 호출자에게 전달"""
+        url, headers = self.build_request(path, params)
+        # 같은 요청의 동시 호출은 한 번으로 병합 (서명 헤더는 매번 달라지므로 URL 기준)
+        response_data = inflight.do(url, lambda: self.transport.get(url, headers=headers, limiter=self.limiter))
+        return jsoncodec.loads(response_data)
+    
+    def keyword_list(self, hint_keywords: str) -> list:
+        """keywordstool 호출 결과의 keywordList (가공 전)"""
+        result = self.get(APIConfig.NAVER_ADS_API_PATH, self.keywordstool_params(hint_keywords))
+        return result.get('keywordList') or []
+    
+    @staticmethod
+    def _stats_cache_key(hint_keywords: str) -> str:
+        """상세 통계 캐시 키 (API와 같은 기준으로 정규화한 시드 키워드)"""
+        return "ads_stats:" + ",".join(normalize_keyword(hint) for hint in hint_keywords.split(","))
+    
+    def cached_keyword_stats(self, hint_keywords: str):
+        """캐시된 상세 통계 레코드 리스트 (없거나 만료되었으면 None)"""
+        if not runtime_config.get('cache_enabled'):
+            return None
+        cached = keyword_stats_cache.get(self._stats_cache_key(hint_keywords))
+        return jsoncodec.loads(cached) if cached is not None else None
+    
+    def store_keyword_stats(self, hint_keywords: str, records: list):
+        """새로 조회한 상세 통계 저장 (빈 결과는 저장하지 않음)
+
+        다음 월간 갱신 시점까지 캐시하고, 시드가 하나인 조회는 (시드 → 연관 키워드)
+        관계를 키워드 그래프에 기록한다. 여러 시드를 묶은 조회는 연관 키워드의 출처를
+        알 수 없어 그래프에 기록하지 않는다.
+        """
+        if not records:
+            return
+        if runtime_config.get('cache_enabled'):
+            keyword_stats_cache.set(
+                self._stats_cache_key(hint_keywords),
+                json.dumps(records, ensure_ascii=False).encode('utf-8'),
+                expires_at=next_monthly_refresh()
+            )
+        if StorageConfig.KEYWORD_GRAPH_ENABLED and "," not in hint_keywords:
+            try:
+                keyword_graph.add_edges(hint_keywords, [record['keyword'] for record in records])
+            except Exception as e:
+                # 그래프 기록 실패가 통계 조회를 막지 않도록 로그만 남김
+                logger.warning("키워드 관계 저장 실패 '%s': %s", hint_keywords, e)
+    
+    def keyword_stats(self, hint_keywords: str, refresh: bool = False) -> list:
+        """키워드 상세 통계 레코드 리스트 (refresh=True면 캐시를 무시하고 새로 조회)"""
+        records = None if refresh else self.cached_keyword_stats(hint_keywords)
+        if records is None:
+            records = parse_detailed_keyword_list(self.keyword_list(hint_keywords))
+            self.store_keyword_stats(hint_keywords, records)
+        return records
+    
+    def keyword_stats_frame(self, hint_keywords: str, refresh: bool = False) -> pd.DataFrame:
+        """키워드 상세 통계 DataFrame (KEYWORD_STATS_SCHEMA, keyword_stats와 같은 캐시 사용)"""
+        records = None if refresh else self.cached_keyword_stats(hint_keywords)
+        if records is not None:
+            return pd.DataFrame.from_records(records, columns=list(KEYWORD_STATS_SCHEMA)).astype(KEYWORD_STATS_SCHEMA)
+        keyword_list = self.keyword_list(hint_keywords)
+        self.store_keyword_stats(hint_keywords, parse_detailed_keyword_list(keyword_list))
+        return parse_keyword_list_frame(keyword_list)
+    
+    @staticmethod
+    def _seed_stats_cache_key(seed: str) -> str:
+        """묶음 조회에서 얻은 시드 자신의 통계 행 캐시 키"""
+        return "ads_seed_stats:" + normalize_keyword(seed)
+    
+    def cached_seed_stats(self, seed: str):
+        """시드 자신의 통계 레코드 - 시드 단독 조회 캐시를 먼저 보고, 없으면 묶음 조회 캐시 확인
+
+        반환값: (레코드 또는 None, 함께 캐시된 연관 키워드 레코드 리스트), 캐시에 없으면 None
+        (묶음 조회 결과에 시드 행이 없었다는 기록이 있으면 (None, []))
+        """
+        if not runtime_config.get('cache_enabled'):
+            return None
+        records = self.cached_keyword_stats(seed)
+        if records is not None:
+            key = normalize_keyword(seed)
+            return next((r for r in records if normalize_keyword(r['keyword']) == key), None), records
+        cached = keyword_stats_cache.get(self._seed_stats_cache_key(seed))
+        if cached is None:
+            return None
+        record = jsoncodec.loads(cached)
+        return (record, [record]) if record is not None else (None, [])
+    
+    def store_seed_stats(self, seed: str, record: dict = None):
+        """묶음 조회에서 얻은 시드 자신의 통계 행 저장 (다음 월간 갱신 시점까지)
+
+        record가 None이면 결과에 시드 행이 없었다는 것을 저장해 같은 달에 다시 조회하지 않는다.
+        """
+        if runtime_config.get('cache_enabled'):
+            keyword_stats_cache.set(
+                self._seed_stats_cache_key(seed),
+                json.dumps(record, ensure_ascii=False).encode('utf-8'),
+                expires_at=next_monthly_refresh()
+            )
+    
+    def keyword_stats_batch(self, seeds: list, batch_size: int = None, max_workers: int = None,
+                            refresh: bool = False) -> dict:
+        """여러 시드 키워드의 상세 통계를 최대 batch_size개씩 묶어 동시에 조회
+
+        keywordstool은 여러 hintKeywords의 결과를 하나의 keywordList로 합쳐 돌려주므로
+        시드 자신의 통계 행(relKeyword가 시드와 같은 행)만 시드별로 나눌 수 있고,
+        연관 키워드는 어느 시드에서 나왔는지 알 수 없어 묶음 단위로 합쳐서 반환한다.
+        
+        캐시는 시드 단위로 사용한다. 시드 단독 조회(연관 키워드/상세 분석 페이지) 캐시나
+        이전 묶음 조회에서 저장한 시드 행이 있으면 재사용하고, 없는 시드만 묶어서 조회한 뒤
+        각 시드의 행을 시드별로 저장하므로 묶음 구성이 달라져도 캐시가 그대로 맞는다.
+        결과에 행이 없는 시드도 없다는 사실을 같은 기간 동안 저장해 매번 다시 조회하지 않는다.
+        묶음 조회로만 얻은 시드는 연관 키워드 없이 시드 행만 'keywords'에 포함된다.
+
+        반환값: {
+            'seeds': {시드: 상세 통계 레코드 또는 None},
+            'keywords': [중복 제거된 상세 통계 레코드 (hint_keywords: 결과를 얻은 시드 또는 시드 묶음)],
+            'errors': {시드: 예외}
+        }
+        """
+        batch_size = max(1, min(batch_size or AppConfig.MAX_HINT_KEYWORDS, AppConfig.MAX_HINT_KEYWORDS))
+        
+        # 정규화 기준으로 중복 시드 제거 (쉼표는 시드 구분자라 포함할 수 없음)
+        unique_seeds = {}
+        for seed in seeds:
+            seed = seed.replace(",", " ").strip()
+            if seed:
+                unique_seeds.setdefault(normalize_keyword(seed), seed)
+        ordered = list(unique_seeds.values())
+        
+        result = {'seeds': {seed: None for seed in ordered}, 'keywords': [], 'errors': {}}
+        seen = set()
+        
+        def collect(records, hint_keywords):
+            for record in records:
+                key = normalize_keyword(record['keyword'])
+                if key not in seen:
+                    seen.add(key)
+                    result['keywords'].append(dict(record, hint_keywords=hint_keywords))
+        
+        # 캐시에 있는 시드는 바로 사용하고, 없는 시드만 조회
+        missing = []
+        for seed in ordered:
+            cached = None if refresh else self.cached_seed_stats(seed)
+            if cached is None:
+                missing.append(seed)
+                continue
+            result['seeds'][seed], records = cached
+            collect(records, seed)
+        
+        batches = [tuple(missing[i:i + batch_size]) for i in range(0, len(missing), batch_size)]
+        fetch = lambda batch: parse_detailed_keyword_list(self.keyword_list(",".join(batch)))
+        for batch, records, error in run_keyword_tasks(batches, fetch, max_workers=max_workers):
+            if error:
+                for seed in batch:
+                    result['errors'][seed] = error
+                continue
+            if len(batch) == 1:
+                # 시드 하나뿐인 묶음은 단독 조회와 같으므로 연관 키워드까지 단독 조회 캐시에 저장
+                self.store_keyword_stats(batch[0], records)
+            by_keyword = {normalize_keyword(record['keyword']): record for record in records}
+            for seed in batch:
+                record = by_keyword.get(normalize_keyword(seed))
+                result['seeds'][seed] = record
+                # 시드 행을 시드별로 저장 (행이 없으면 None) - 단독 조회는 결과가 비어 위에서 저장되지 않은 경우만
+                if len(batch) > 1 or not records:
+                    self.store_seed_stats(seed, record)
+            collect(records, ",".join(batch))
+        return result
+    
+    def related_keywords(self, hint_keywords: str, refresh: bool = False) -> list:
+        """연관 키워드 레코드 리스트 (상세 통계의 요약 보기)"""
+        return [to_related_keyword(detail) for detail in self.keyword_stats(hint_keywords, refresh)]
+
+# 앱 전체가 공유하는 기본 검색광고 클라이언트
+ads_client = SearchAdsClient()
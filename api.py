@@ -3,336 +3,464 @@ API module for the marketing tool
 네이버 쇼핑 API 및 검색광고 API 관련 기능
 """
 
-import json
-import urllib.request
+import logging
 import urllib.parse
 import re
-import time
-import hashlib
-import hmac
-import base64
 from collections import Counter
-import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
 from config import APIConfig, AppConfig, DebugConfig
+from ads_client import ads_client
+from cache import serp_cache
+import jsoncodec
+from ratelimit import shopping_limiter
+from runtime_config import runtime_config
+from singleflight import inflight
+from transport import RetryBudget, default_transport
 
-def get_signature(method: str, uri: str, timestamp: str, access_key: str, secret_key: str) -> str:
-    """네이버 검색광고 API 인증을 위한 서명 생성"""
-    message = f"{timestamp}.{method}.{uri}"
-    signature = base64.b64encode(
-        hmac.new(secret_key.encode(), message.encode(), hashlib.sha256).digest()
-    ).decode()
-    return signature
+logger = logging.getLogger(__name__)
 
-def get_related_keywords_from_ads_api(keyword: str) -> list:
+try:
+    import streamlit as st
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+except ImportError:  # 헤드리스 실행 환경 (CLI, 추적기)
+    st = None
+    get_script_run_ctx = None
+
+def _report(level: str, message: str):
+    """사용자 알림 - Streamlit 스크립트 실행 중이면 화면에, 아니면 로그로 출력
+
+    st.error/st.write 를 직접 부르면 CLI나 워커 스레드에서는 표시되지 않거나 경고만 남으므로
+    api 모듈의 모든 알림은 이 함수를 거친다.
+    """
+    if st is not None and get_script_run_ctx(suppress_warning=True) is not None:
+        getattr(st, level)(message)
+        return
+    log_level = {"error": logging.ERROR, "write": logging.DEBUG}.get(level, logging.INFO)
+    logger.log(log_level, message)
+
+def get_related_keywords_from_ads_api(keyword: str, refresh: bool = False) -> list:
     """네이버 검색광고 API를 사용하여 연관 키워드 추출"""
     try:
         # 인증 정보 확인
-        if not all([APIConfig.ACCESS_LICENSE, APIConfig.SECRET_KEY, APIConfig.CUSTOMER_ID]):
-            st.error("❌ 네이버 검색광고 API 설정이 필요합니다.")
+        if not ads_client.has_credentials:
+            _report("error", "❌ 네이버 검색광고 API 설정이 필요합니다.")
             return []
         
-        # 타임스탬프 생성
-        timestamp = str(int(time.time() * 1000))
-        
-        # 서명 생성
-        signature = get_signature("GET", APIConfig.NAVER_ADS_API_PATH, timestamp, 
-                                 APIConfig.ACCESS_LICENSE, APIConfig.SECRET_KEY)
-        
-        # 헤더 설정
-        headers = {
-            "X-Timestamp": timestamp,
-            "X-API-KEY": APIConfig.ACCESS_LICENSE,
-            "X-Customer": APIConfig.CUSTOMER_ID,
-            "X-Signature": signature,
-            "Content-Type": "application/json"
-        }
-        
-        # GET 방식으로 쿼리 파라미터 전송
-        query_params = urllib.parse.urlencode({
-            'hintKeywords': keyword,
-            'showDetail': '1'
-        })
-        url = f"{APIConfig.NAVER_ADS_API_BASE_URL}{APIConfig.NAVER_ADS_API_PATH}?{query_params}"
-        request = urllib.request.Request(url, headers=headers, method="GET")
+        related_keywords = ads_client.related_keywords(keyword, refresh)
         
-        with urllib.request.urlopen(request) as response:
-            response_data = response.read()
-            result = json.loads(response_data.decode('utf-8'))
-            
         # 디버깅 정보 표시
         if DebugConfig.SHOW_DEBUG_INFO:
-            st.write(f"API 응답 상태: OK")
-            if 'keywordList' in result:
-                st.write(f"API에서 받은 키워드 수: {len(result['keywordList'])}")
-            else:
-                st.write(f"API 응답 구조: {list(result.keys())}")
-                
-        # 결과 처리
-        related_keywords = []
-        if 'keywordList' in result and result['keywordList']:
-            for item in result['keywordList']:
-                # 키워드가 비어있지 않은지 확인
-                keyword_text = item.get('relKeyword', '').strip()
-                if not keyword_text:
-                    continue
-                    
-                # 검색량 처리
-                pc_qc = item.get('monthlyPcQcCnt', 0)
-                mobile_qc = item.get('monthlyMobileQcCnt', 0)
-                
-                # "< 10" 같은 문자열 처리
-                if isinstance(pc_qc, str):
-                    pc_qc = 5 if "< 10" in pc_qc else 0
-                if isinstance(mobile_qc, str):
-                    mobile_qc = 5 if "< 10" in mobile_qc else 0
-                
-                # 숫자가 아닌 경우 0으로 처리
-                try:
-                    pc_qc = int(pc_qc) if pc_qc else 0
-                    mobile_qc = int(mobile_qc) if mobile_qc else 0
-                except (ValueError, TypeError):
-                    pc_qc = 0
-                    mobile_qc = 0
-                
-                related_keywords.append({
-                    'keyword': keyword_text,
-                    'monthly_pc_qc': pc_qc,
-                    'monthly_mobile_qc': mobile_qc,
-                    'competition': item.get('compIdx', 'N/A'),
-                    'source': 'ads_api'
-                })
-        
-        if DebugConfig.SHOW_DEBUG_INFO:
-            st.write(f"처리된 키워드 수: {len(related_keywords)}")
+            _report("write", f"처리된 키워드 수: {len(related_keywords)}")
         
         return related_keywords
         
     except Exception as e:
-        st.error(f"❌ 검색광고 API 오류: {e}")
+        _report("error", f"❌ 검색광고 API 오류: {e}")
         return []
 
-def get_detailed_keyword_stats(keyword: str) -> list:
+def fetch_detailed_keyword_stats(keyword: str, refresh: bool = False) -> list:
+    """키워드 상세 통계 조회 - 오류는 호출자에게 그대로 전달 (백그라운드 작업용)
+
+    월간 통계는 다음 갱신 시점까지 디스크에 캐시되며, refresh=True면 새로 조회한다.
+    """
+    return ads_client.keyword_stats(keyword, refresh)
+
+def fetch_keyword_stats_for_seeds(seeds: list, refresh: bool = False) -> dict:
+    """여러 시드 키워드의 상세 통계를 묶음 호출로 조회 (100개 시드 → 약 20회 호출)"""
+    return ads_client.keyword_stats_batch(seeds, refresh=refresh)
+
+def get_detailed_keyword_stats(keyword: str, refresh: bool = False) -> list:
     """네이버 검색광고 API를 사용하여 키워드의 상세 통계 정보 추출"""
     try:
         # 인증 정보 확인
-        if not all([APIConfig.ACCESS_LICENSE, APIConfig.SECRET_KEY, APIConfig.CUSTOMER_ID]):
-            st.error("❌ 네이버 검색광고 API 설정이 필요합니다.")
+        if not ads_client.has_credentials:
+            _report("error", "❌ 네이버 검색광고 API 설정이 필요합니다.")
             return []
         
-        # 타임스탬프 생성
-        timestamp = str(int(time.time() * 1000))
-        
-        # 서명 생성
-        signature = get_signature("GET", APIConfig.NAVER_ADS_API_PATH, timestamp, 
-                                 APIConfig.ACCESS_LICENSE, APIConfig.SECRET_KEY)
-        
-        # 헤더 설정
-        headers = {
-            "X-Timestamp": timestamp,
-            "X-API-KEY": APIConfig.ACCESS_LICENSE,
-            "X-Customer": APIConfig.CUSTOMER_ID,
-            "X-Signature": signature,
-            "Content-Type": "application/json"
-        }
-        
-        # GET 방식으로 쿼리 파라미터 전송
-        query_params = urllib.parse.urlencode({
-            'hintKeywords': keyword,
-            'showDetail': '1'
-        })
-        url = f"{APIConfig.NAVER_ADS_API_BASE_URL}{APIConfig.NAVER_ADS_API_PATH}?{query_params}"
-        request = urllib.request.Request(url, headers=headers, method="GET")
-        
-        with urllib.request.urlopen(request) as response:
-            response_data = response.read()
-            result = json.loads(response_data.decode('utf-8'))
-        
-        # 결과 처리 - 상세 통계 포함
-        detailed_keywords = []
-        if 'keywordList' in result and result['keywordList']:
-            for item in result['keywordList']:
-                keyword_text = item.get('relKeyword', '').strip()
-                if not keyword_text:
-                    continue
-                
-                # 기본 통계 처리
-                def process_stat(value):
-                    """통계 값 처리 (문자열 및 특수 케이스 처리)"""
-                    if isinstance(value, str):
-                        if "< 10" in value:
-                            return 5
-                        elif "-" in value or value == "":
-                            return 0
-                    try:
-                        return int(value) if value else 0
-                    except (ValueError, TypeError):
-                        return 0
-                
-                # PC 통계 - 안전한 처리
-                pc_search = process_stat(item.get('monthlyPcQcCnt', 0))
-                pc_click = process_stat(item.get('monthlyAvePcClkCnt', 0))
-                
-                # CTR 값 안전 처리
-                try:
-                    pc_ctr_raw = item.get('monthlyAvePcCtr', 0.0)
-                    if isinstance(pc_ctr_raw, str):
-                        pc_ctr = float(pc_ctr_raw) if pc_ctr_raw and pc_ctr_raw != '-' else 0.0
-                    else:
-                        pc_ctr = float(pc_ctr_raw) if pc_ctr_raw else 0.0
-                except (ValueError, TypeError):
-                    pc_ctr = 0.0
-                
-                pc_exposure = process_stat(item.get('plAvgDepth', 0))  # 광고 노출 수
-                
-                # 모바일 통계 - 안전한 처리
-                mobile_search = process_stat(item.get('monthlyMobileQcCnt', 0))
-                mobile_click = process_stat(item.get('monthlyAveMobileClkCnt', 0))
-                
-                # 모바일 CTR 값 안전 처리
-                try:
-                    mobile_ctr_raw = item.get('monthlyAveMobileCtr', 0.0)
-                    if isinstance(mobile_ctr_raw, str):
-                        mobile_ctr = float(mobile_ctr_raw) if mobile_ctr_raw and mobile_ctr_raw != '-' else 0.0
-                    else:
-                        mobile_ctr = float(mobile_ctr_raw) if mobile_ctr_raw else 0.0
-                except (ValueError, TypeError):
-                    mobile_ctr = 0.0
-                
-                mobile_exposure = process_stat(item.get('plAvgDepth', 0))  # 모바일도 동일한 필드 사용
-                
-                # 경쟁 정보 처리 개선
-                competition_index = item.get('compIdx', 'N/A')
-                
-                # 경쟁도 처리 - 문자열과 숫자 모두 처리
-                if competition_index != 'N/A' and competition_index is not None:
-                    try:
-                        # 이미 문자열인 경우 그대로 사용
-                        if isinstance(competition_index, str):
-                            if competition_index in ['낮음', '보통', '높음']:
-                                competition_level = competition_index
-                                # 문자열을 숫자로 역변환 (광고수 계산용)
-                                if competition_index == '낮음':
-                                    comp_idx_numeric = 20
-                                elif competition_index == '보통':
-                                    comp_idx_numeric = 50
-                                else:  # '높음'
-                                    comp_idx_numeric = 80
-                            else:
-                                # 숫자형 문자열인 경우
-                                comp_idx_numeric = float(competition_index)
-                                if comp_idx_numeric <= 30:
-                                    competition_level = '낮음'
-                                elif comp_idx_numeric <= 70:
-                                    competition_level = '보통'
-                                else:
-                                    competition_level = '높음'
-                        else:
-                            # 숫자인 경우
-                            comp_idx_numeric = float(competition_index)
-                            if comp_idx_numeric <= 30:
-                                competition_level = '낮음'
-                            elif comp_idx_numeric <= 70:
-                                competition_level = '보통'
-                            else:
-                                competition_level = '높음'
-                    except (ValueError, TypeError):
-                        competition_level = '알 수 없음'
-                        comp_idx_numeric = 50  # 기본값
-                else:
-                    competition_level = '알 수 없음'
-                    comp_idx_numeric = 50  # 기본값
-                
-                detailed_keywords.append({
-                    'keyword': keyword_text,
-                    # 월간 검색수
-                    'monthly_pc_search': pc_search,
-                    'monthly_mobile_search': mobile_search,
-                    'total_monthly_search': pc_search + mobile_search,
-                    
-                    # 월평균 클릭수
-                    'monthly_avg_pc_click': pc_click,
-                    'monthly_avg_mobile_click': mobile_click,
-                    'total_monthly_avg_click': pc_click + mobile_click,
-                    
-                    # 월평균 클릭률
-                    'monthly_avg_pc_ctr': pc_ctr,
-                    'monthly_avg_mobile_ctr': mobile_ctr,
-                    'total_monthly_avg_ctr': (pc_ctr + mobile_ctr) / 2 if pc_ctr > 0 or mobile_ctr > 0 else 0,
-                    
-                    # 경쟁 정보
-                    'competition_index': competition_index,
-                    'competition_level': competition_level,
-                    
-                    # 노출 관련 (광고 깊이를 노출 수 대용으로 사용)
-                    'pc_exposure': pc_exposure,
-                    'mobile_exposure': mobile_exposure,
-                    'total_exposure': pc_exposure + mobile_exposure,
-                    
-                    # 광고수 (경쟁도 기반 추정) - 안전한 처리
-                    'estimated_ads_count': max(1, int(comp_idx_numeric / 10)),
-                    
-                    # 기타
-                    'source': 'search_ads_api'
-                })
-        
-        return detailed_keywords
+        return fetch_detailed_keyword_stats(keyword, refresh)
         
     except Exception as e:
-        st.error(f"❌ 검색광고 API 상세 분석 오류: {e}")
+        _report("error", f"❌ 검색광고 API 상세 분석 오류: {e}")
         return []
 
-def get_related_keywords(keyword: str) -> list:
+def get_related_keywords(keyword: str, refresh: bool = False) -> list:
     """네이버 검색광고 API를 사용하여 연관 키워드 및 상세 통계 추출"""
-    st.info("🎯 네이버 검색광고 API에서 상세 키워드 데이터 수집 중...")
+    _report("info", "🎯 네이버 검색광고 API에서 상세 키워드 데이터 수집 중...")
     
     # 상세 통계 데이터 수집
-    detailed_keywords = get_detailed_keyword_stats(keyword)
+    detailed_keywords = get_detailed_keyword_stats(keyword, refresh)
     
     if detailed_keywords:
         # 검색량 기준으로 정렬
         detailed_keywords.sort(key=lambda x: x.get('total_monthly_search', 0), reverse=True)
-        st.success(f"🎉 총 {len(detailed_keywords)}개의 연관 키워드와 상세 통계를 발견했습니다!")
+        _report("success", f"🎉 총 {len(detailed_keywords)}개의 연관 키워드와 상세 통계를 발견했습니다!")
         return detailed_keywords
     else:
-        st.error("❌ 연관 키워드를 찾을 수 없습니다.")
+        _report("error", "❌ 연관 키워드를 찾을 수 없습니다.")
         return []
 
-def get_top_ranked_product_by_mall(keyword: str, mall_name: str) -> dict:
-    """네이버 쇼핑에서 특정 키워드로 검색하여 지정된 판매처의 최고 순위 상품을 찾는 함수"""
+# 상품명의 <b> 등 HTML 태그 제거용 (미리 컴파일)
+_HTML_TAG_RE = re.compile(r"<[^>]*>")
+
+def clean_title(title: str) -> str:
+    """상품명에서 HTML 태그 제거"""
+    if "<" not in title:
+        return title
+    return _HTML_TAG_RE.sub("", title)
+
+class ProductRecord:
+    """쇼핑 검색 결과 상품 한 건 - 순위 확인에 필요한 필드만 담는 경량 레코드"""
+    
+    __slots__ = ("rank", "product_id", "mall_name", "price", "title", "link")
+    
+    def __init__(self, rank: int, product_id: str, mall_name: str, price: int, title: str, link: str):
+        self.rank = rank
+        self.product_id = product_id
+        self.mall_name = mall_name
+        self.price = price
+        self.title = title
+        self.link = link
+    
+    @classmethod
+    def from_item(cls, item: dict, rank: int):
+        """shop.json items 항목 하나로 레코드 생성"""
+        lprice = item.get("lprice")
+        return cls(
+            rank=rank,
+            product_id=item.get("productId", ""),
+            mall_name=item.get("mallName", ""),
+            price=int(lprice) if lprice and str(lprice).isdigit() else 0,
+            title=clean_title(item.get("title", "")),
+            link=item.get("link", "")
+        )
+    
+    def to_dict(self) -> dict:
+        """화면 표시용 딕셔너리로 변환"""
+        return {
+            "rank": self.rank,
+            "title": self.title,
+            "price": self.price,
+            "link": self.link,
+            "mallName": self.mall_name,
+            "productId": self.product_id
+        }
+
+def build_shopping_request(keyword: str, start: int, display: int) -> tuple:
+    """shop.json 페이지 요청용 (URL, 헤더, 캐시 키) 생성"""
     encText = urllib.parse.quote(keyword)
-    seen_titles = set()
-    best_product = None
+    url = f"{APIConfig.NAVER_SHOPPING_API_URL}?query={encText}&display={display}&start={start}"
+    headers = {
+        "X-Naver-Client-Id": APIConfig.NAVER_CLIENT_ID,
+        "X-Naver-Client-Secret": APIConfig.NAVER_CLIENT_SECRET
+    }
+    return url, headers, f"shop:{keyword}:{display}:{start}"
+
+def _download_shopping_page(url: str, headers: dict, cache_key: str, retry_budget: RetryBudget = None) -> bytes:
+    """shop.json 페이지 응답 본문을 받아 캐시에 저장"""
+    response_data = default_transport.get(url, headers=headers, limiter=shopping_limiter, retry_budget=retry_budget)
+    if runtime_config.get('cache_enabled'):
+        serp_cache.set(cache_key, response_data)
+    return response_data
+
+def fetch_shopping_page(keyword: str, start: int, display: int = AppConfig.RESULTS_PER_PAGE,
+                        retry_budget: RetryBudget = None) -> list:
+    """네이버 쇼핑 API 검색 결과 한 페이지(items) 조회"""
+    url, headers, cache_key = build_shopping_request(keyword, start, display)
     
-    for start in range(1, AppConfig.MAX_SEARCH_RESULTS + 1, AppConfig.RESULTS_PER_PAGE):
-        url = f"{APIConfig.NAVER_SHOPPING_API_URL}?query={encText}&display={AppConfig.RESULTS_PER_PAGE}&start={start}"
-        request = urllib.request.Request(url)
-        request.add_header("X-Naver-Client-Id", APIConfig.NAVER_CLIENT_ID)
-        request.add_header("X-Naver-Client-Secret", APIConfig.NAVER_CLIENT_SECRET)
-        
-        try:
-            response = urllib.request.urlopen(request)
-            result = json.loads(response.read())
+    # 동일한 (query, display, start) 페이지는 유효 시간 내 캐시에서 반환
+    response_data = serp_cache.get(cache_key) if runtime_config.get('cache_enabled') else None
+    
+    if response_data is None:
+        # 다른 세션이 같은 페이지를 조회 중이면 그 응답을 함께 사용
+        response_data = inflight.do(cache_key, lambda: _download_shopping_page(url, headers, cache_key, retry_budget))
+    
+    result = jsoncodec.loads(response_data)
+    return result.get("items", [])
+
+def iter_shopping_pages(keyword: str, parallel: bool = False, retry_budget: RetryBudget = None):
+    """검색 결과 페이지를 순위 순서대로 (start, items) 형태로 반환
+
+    parallel=True 이면 전체 페이지를 제한된 워커 풀로 동시에 요청하고,
+    결과는 요청 순서(= 순위 순서) 그대로 돌려준다.
+    """
+    starts = list(range(1, AppConfig.MAX_SEARCH_RESULTS + 1, AppConfig.RESULTS_PER_PAGE))
+    
+    if not parallel:
+        for start in starts:
+            yield start, fetch_shopping_page(keyword, start, retry_budget=retry_budget)
+        return
+    
+    workers = max(1, min(AppConfig.MAX_FETCH_WORKERS, len(starts)))
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(fetch_shopping_page, keyword, start, retry_budget=retry_budget) for start in starts]
+        # 제출 순서대로 결과를 꺼내므로 순위 순서가 유지됨
+        for start, future in zip(starts, futures):
+            yield start, future.result()
+    finally:
+        # 조기 종료 시 아직 시작하지 않은 페이지 요청은 취소
+        executor.shutdown(wait=False, cancel_futures=True)
+
+class MallRankResolver:
+    """순위 순서대로 들어오는 검색 결과 페이지에서 판매처별 상품을 가려내는 상태 객체
+
+    전체 스캔과 증분 재확인이 같은 판정 로직을 공유하도록 페이지 조회와 분리되어 있다.
+    """
+    
+    def __init__(self, mall_names: list, collect_all: bool = False):
+        self.mall_names = list(mall_names)
+        self.collect_all = collect_all
+        self.pending = set(self.mall_names)
+        self._seen_products = {name: set() for name in self.mall_names}
+    
+    @property
+    def done(self) -> bool:
+        """모든 판매처의 최고 순위가 확정되었는지 여부 (collect_all이면 항상 False)"""
+        return not self.collect_all and not self.pending
+    
+    def feed(self, start: int, items: list) -> list:
+        """start 위치에서 시작하는 페이지 하나를 처리하여 새로 찾은 (판매처명, 레코드) 목록 반환"""
+        found = []
+        for idx, item in enumerate(items, start=start):
+            item_mall = item.get("mallName")
+            if not item_mall:
+                continue
             
-            for idx, item in enumerate(result.get("items", []), start=1):
-                if item.get("mallName") and mall_name in item["mallName"]:
-                    title_clean = re.sub(r"<.*?>", "", item["title"])
-                    if title_clean in seen_titles:
-                        continue
-                    seen_titles.add(title_clean)
-                    
-                    rank = start + idx - 1
-                    product = {
-                        "rank": rank,
-                        "title": title_clean,
-                        "price": item["lprice"],
-                        "link": item["link"],
-                        "mallName": item["mallName"]
-                    }
-                    
-                    if not best_product or rank < best_product["rank"]:
-                        best_product = product
-        except Exception as e:
-            st.error(f"API 요청 중 오류가 발생했습니다: {e}")
+            record = None
+            for name in self.mall_names:
+                if name not in item_mall or (not self.collect_all and name not in self.pending):
+                    continue
+                if record is None:
+                    record = ProductRecord.from_item(item, rank=idx)
+                # 같은 상품이 여러 번 노출되면 최고 순위 한 번만 반환 (productId 기준)
+                product_key = record.product_id or record.title
+                if product_key in self._seen_products[name]:
+                    continue
+                self._seen_products[name].add(product_key)
+                self.pending.discard(name)
+                found.append((name, record))
+            
+            if self.done:
+                break
+        return found
+
+def iter_malls_products(keyword: str, mall_names: list, collect_all: bool = False, parallel: bool = False):
+    """한 번의 검색 결과 크롤링으로 여러 판매처의 상품을 순위 순서대로 (판매처명, 상품) 스트리밍 반환
+
+    페이지는 순위 오름차순으로 도착하므로 판매처별 첫 번째 상품이 최고 순위다.
+    collect_all=False 이면 모든 판매처의 최고 순위가 확정되는 즉시 스캔을 멈춘다.
+    """
+    resolver = MallRankResolver(mall_names, collect_all=collect_all)
+    
+    # 일시적인 오류는 재시도하되, 키워드 하나가 쓸 수 있는 재시도 횟수는 제한
+    retry_budget = RetryBudget()
+    
+    for start, items in iter_shopping_pages(keyword, parallel=parallel, retry_budget=retry_budget):
+        yield from resolver.feed(start, items)
+        
+        # 모든 판매처의 최고 순위가 확정되었거나 마지막 페이지에 도달하면 더 요청하지 않음
+        if resolver.done or len(items) < AppConfig.RESULTS_PER_PAGE:
+            return
+
+def iter_mall_products(keyword: str, mall_name: str, collect_all: bool = False, parallel: bool = False):
+    """판매처 상품을 순위 순서대로 스트리밍 반환
+
+    페이지는 순위 오름차순으로 도착하므로 첫 번째로 찾은 상품이 최고 순위다.
+    collect_all=False 이면 그 즉시 스캔을 멈추고, True 이면 모든 노출 상품을 반환한다.
+    """
+    for _, record in iter_malls_products(keyword, [mall_name], collect_all=collect_all, parallel=parallel):
+        yield record
+
+def get_top_ranked_product_by_mall(keyword: str, mall_name: str, parallel: bool = False,
+                                   raise_errors: bool = False) -> dict:
+    """네이버 쇼핑에서 특정 키워드로 검색하여 지정된 판매처의 최고 순위 상품을 찾는 함수
+
+    raise_errors=True 이면 오류를 화면에 표시하지 않고 호출자에게 그대로 전달한다
+    (백그라운드 작업에서 오류를 "검색 결과 없음"과 구분하기 위함).
+    """
+    try:
+        record = next(iter_mall_products(keyword, mall_name, parallel=parallel), None)
+        return record.to_dict() if record else None
+    except Exception as e:
+        if raise_errors:
+            raise
+        _report("error", f"API 요청 중 오류가 발생했습니다: {e}")
+        return None
+
+def _recheck_page_order(last_rank: int, page_count: int) -> list:
+    """이전 순위가 있던 페이지부터 바깥쪽으로 넓혀 가는 페이지 인덱스 순서 (p, p-1, p+1, p-2, ...)"""
+    center = min(max(0, (last_rank - 1) // AppConfig.RESULTS_PER_PAGE), page_count - 1)
+    order = [center]
+    for distance in range(1, page_count):
+        for index in (center - distance, center + distance):
+            if 0 <= index < page_count:
+                order.append(index)
+    return order
+
+def recheck_top_ranked_product(keyword: str, mall_name: str, last_known: dict, prove_best: bool = False,
+                               raise_errors: bool = False) -> dict:
+    """이전 확인 결과를 이용한 증분 재확인
+
+    last_known({'rank', 'productId'})의 순위가 있던 페이지부터 조회하고, 찾지 못하면 앞뒤로 넓혀 간다.
+    추적 중인 상품(productId)이나 판매처 상품을 찾으면 바로 멈추므로 순위 변동이 작으면 1회 호출로 끝난다.
+    탐색 중 조회하지 않은 앞 페이지가 있으면 결과는 판매처 최고 순위가 아닐 수 있다.
+    
+    판매처 전체의 최고 순위를 확정하려면 그 앞의 모든 페이지를 봐야 하므로,
+    prove_best=True 이면 탐색 없이 1페이지부터 조기 종료 스캔을 한다 (탐색 후 앞 페이지를
+    다시 채우는 것보다 호출 수가 적거나 같음).
+    반환값에는 최고 순위가 확정되었는지를 나타내는 'proven' 키가 포함된다.
+    """
+    if prove_best or not last_known or not last_known.get('rank'):
+        # 앞에서부터 스캔하여 처음 찾은 상품에서 멈추면 항상 최고 순위가 확정됨
+        product = get_top_ranked_product_by_mall(keyword, mall_name, raise_errors=raise_errors)
+        return dict(product, proven=True) if product else None
+    
+    starts = list(range(1, AppConfig.MAX_SEARCH_RESULTS + 1, AppConfig.RESULTS_PER_PAGE))
+    tracked_id = last_known.get('productId')
+    retry_budget = RetryBudget()
+    fetched = {}
+    
+    def matches_in(index):
+        """조회한 페이지 하나의 판매처 상품 (순위 순)"""
+        resolver = MallRankResolver([mall_name], collect_all=True)
+        return [record for _, record in resolver.feed(starts[index], fetched[index])]
+    
+    try:
+        # 1단계: 이전 위치부터 바깥쪽으로 최대 RECHECK_PROBE_PAGES 페이지 탐색
+        found_index = None
+        page_count = len(starts)  # 짧은 페이지를 만나면 그 뒤 페이지는 결과가 없으므로 조회하지 않음
+        probe_order = _recheck_page_order(last_known['rank'], len(starts))[:AppConfig.RECHECK_PROBE_PAGES]
+        for index in probe_order:
+            if index >= page_count:
+                continue
+            fetched[index] = fetch_shopping_page(keyword, starts[index], retry_budget=retry_budget)
+            if len(fetched[index]) < AppConfig.RESULTS_PER_PAGE:
+                page_count = index + 1
+            records = matches_in(index)
+            if records and (not tracked_id or any(r.product_id == tracked_id for r in records)):
+                found_index = index
+                break
+        
+        if found_index is None:
+            # 순위가 크게 바뀌었으면 앞에서부터 스캔 (이미 조회한 페이지는 재사용)
+            for index in range(len(starts)):
+                if index not in fetched:
+                    fetched[index] = fetch_shopping_page(keyword, starts[index], retry_budget=retry_budget)
+                records = matches_in(index)
+                if records:
+                    return dict(records[0].to_dict(), proven=True)
+                if len(fetched[index]) < AppConfig.RESULTS_PER_PAGE:
+                    break
+            return None
+        
+        # 2단계: 찾은 위치 앞의 페이지를 앞에서부터 확인하여 최고 순위 확정
+        # (탐색 중 이미 조회한 앞 페이지도 확인하고, 조회하지 않은 페이지를 건너뛰면 미확정)
+        proven = True
+        for index in range(found_index):
+            if index not in fetched:
+                proven = False
+                continue
+            records = matches_in(index)
+            if records:
+                return dict(records[0].to_dict(), proven=proven)
+        
+        return dict(matches_in(found_index)[0].to_dict(), proven=proven)
+    except Exception as e:
+        if raise_errors:
+            raise
+        _report("error", f"API 요청 중 오류가 발생했습니다: {e}")
+        return None
+
+def get_all_ranked_products_by_mall(keyword: str, mall_name: str, parallel: bool = True) -> list:
+    """지정된 판매처의 모든 노출 상품을 순위 순서대로 반환"""
+    products = []
+    try:
+        for record in iter_mall_products(keyword, mall_name, collect_all=True, parallel=parallel):
+            products.append(record.to_dict())
+    except Exception as e:
+        # 오류가 난 페이지 이전까지의 결과는 유지
+        _report("error", f"API 요청 중 오류가 발생했습니다: {e}")
+    return products
+
+def get_top_ranked_products_by_malls(keyword: str, mall_names: list, collect_all: bool = False) -> dict:
+    """키워드 검색 결과를 한 번만 크롤링하여 여러 판매처의 순위를 함께 확인
+
+    반환값은 {판매처명: 최고 순위 상품 또는 None} 이며,
+    collect_all=True 이면 {판매처명: 모든 노출 상품 리스트} 를 반환한다.
+    """
+    mall_names = list(dict.fromkeys(mall_names))
+    results = {name: [] for name in mall_names}
+    
+    try:
+        for name, record in iter_malls_products(keyword, mall_names, collect_all=collect_all, parallel=collect_all):
+            results[name].append(record.to_dict())
+    except Exception as e:
+        # 오류가 난 페이지 이전까지의 결과는 유지
+        _report("error", f"API 요청 중 오류가 발생했습니다: {e}")
+    
+    if collect_all:
+        return results
+    return {name: (products[0] if products else None) for name, products in results.items()}
+
+# 검색 결과 스냅샷 컬럼 스키마 (shop.json items 필드 + 순위)
+SERP_SNAPSHOT_SCHEMA = {
+    "rank": "int32",
+    "productId": "string",
+    "title": "string",
+    "link": "string",
+    "image": "string",
+    "lprice": "Int64",
+    "hprice": "Int64",
+    "mallName": "string",
+    "productType": "Int8",
+    "brand": "string",
+    "maker": "string",
+    "category1": "category",
+    "category2": "category",
+    "category3": "category",
+    "category4": "category",
+}
+
+def _to_int_or_none(value):
+    """문자열 숫자를 정수로 변환 (빈 값은 None)"""
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+def fetch_serp_snapshot(keyword: str, parallel: bool = True) -> pd.DataFrame:
+    """키워드 검색 결과 전체(최대 MAX_SEARCH_RESULTS개)를 타입이 지정된 DataFrame으로 반환
+
+    한 번의 크롤링 결과로 순위, 가격 분포, 판매처 점유율, 카테고리 등을 모두 계산할 수 있다.
+    """
+    columns = {name: [] for name in SERP_SNAPSHOT_SCHEMA}
+    int_columns = ("lprice", "hprice", "productType")
+    retry_budget = RetryBudget()
+    
+    for start, items in iter_shopping_pages(keyword, parallel=parallel, retry_budget=retry_budget):
+        columns["rank"].extend(range(start, start + len(items)))
+        for name, values in columns.items():
+            if name == "rank":
+                continue
+            if name == "title":
+                values.extend(clean_title(item.get("title", "")) for item in items)
+            elif name in int_columns:
+                values.extend(_to_int_or_none(item.get(name)) for item in items)
+            else:
+                values.extend(item.get(name) or None for item in items)
+        
+        if len(items) < AppConfig.RESULTS_PER_PAGE:
             break
     
-    return best_product
\ No newline at end of file
+    return pd.DataFrame(columns).astype(SERP_SNAPSHOT_SCHEMA)
+
+def get_serp_snapshot(keyword: str) -> pd.DataFrame:
+    """네이버 쇼핑 검색 결과 전체 스냅샷 조회 (오류 시 빈 DataFrame)"""
+    try:
+        return fetch_serp_snapshot(keyword)
+    except Exception as e:
+        _report("error", f"API 요청 중 오류가 발생했습니다: {e}")
+        return pd.DataFrame({name: pd.Series(dtype=dtype) for name, dtype in SERP_SNAPSHOT_SCHEMA.items()})
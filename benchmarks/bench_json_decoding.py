@@ -0,0 +1,65 @@
+"""
+JSON 디코딩 벤치마크 - shop.json 페이지와 keywordstool 응답 하나당 디코딩 시간 비교
+
+사용법: python benchmarks/bench_json_decoding.py
+"""
+
+import json
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jsoncodec
+
+def make_shopping_page(items: int = 100, seed: int = 0) -> bytes:
+    """shop.json 한 페이지(display=100)와 비슷한 응답 본문"""
+    rng = random.Random(seed)
+    return json.dumps({
+        "lastBuildDate": "Mon, 01 Sep 2025 10:00:00 +0900",
+        "total": 1234567, "start": 1, "display": items,
+        "items": [{
+            "title": f"<b>캠핑</b> 의자 접이식 경량 릴렉스 체어 {i}",
+            "link": f"https://search.shopping.naver.com/catalog/{rng.randint(10**10, 10**11)}",
+            "image": f"https://shopping-phinf.pstatic.net/main_{rng.randint(10**7, 10**8)}/{i}.jpg",
+            "lprice": str(rng.randint(5000, 300000)), "hprice": "",
+            "mallName": rng.choice(["네이버", "쿠팡", "캠핑몰", "아웃도어샵"]),
+            "productId": str(rng.randint(10**10, 10**11)), "productType": "1",
+            "brand": "브랜드", "maker": "제조사",
+            "category1": "스포츠/레저", "category2": "캠핑", "category3": "캠핑가구", "category4": "캠핑의자"
+        } for i in range(items)]
+    }, ensure_ascii=False).encode("utf-8")
+
+def make_keywordstool_response(rows: int = 1000, seed: int = 0) -> bytes:
+    """keywordstool 응답(showDetail=1)과 비슷한 본문"""
+    rng = random.Random(seed)
+    return json.dumps({"keywordList": [{
+        "relKeyword": f"캠핑의자{i}",
+        "monthlyPcQcCnt": rng.choice(["< 10", rng.randint(10, 100000)]),
+        "monthlyMobileQcCnt": rng.randint(10, 500000),
+        "monthlyAvePcClkCnt": round(rng.uniform(0, 300), 1),
+        "monthlyAveMobileClkCnt": round(rng.uniform(0, 3000), 1),
+        "monthlyAvePcCtr": round(rng.uniform(0, 5), 2),
+        "monthlyAveMobileCtr": round(rng.uniform(0, 5), 2),
+        "plAvgDepth": rng.randint(0, 15),
+        "compIdx": rng.choice(["낮음", "중간", "높음"])
+    } for i in range(rows)]}, ensure_ascii=False).encode("utf-8")
+
+def bench(label: str, body: bytes, number: int = 200):
+    """응답 하나당 디코딩 시간(µs)을 백엔드별로 출력"""
+    print(f"{label} ({len(body) / 1024:.0f} KB)")
+    cases = [("json (str 변환 후)", lambda: json.loads(body.decode("utf-8")))]
+    cases += [(f"{name} (bytes)", lambda fn=fn: fn(body)) for name, fn in jsoncodec.BACKENDS.items()]
+    baseline = None
+    for name, fn in cases:
+        elapsed = min(timeit.repeat(fn, number=number, repeat=5)) / number * 1_000_000
+        baseline = baseline or elapsed
+        print(f"  {name:<20} {elapsed:9.1f} µs  (x{baseline / elapsed:.1f})")
+
+if __name__ == "__main__":
+    print(f"사용 중인 백엔드: {jsoncodec.backend} / 설치된 백엔드: {', '.join(jsoncodec.BACKENDS)}")
+    bench("shop.json 100개 항목", make_shopping_page())
+    bench("keywordstool 1,000행", make_keywordstool_response())
+    bench("keywordstool 5,000행", make_keywordstool_response(5000), number=40)
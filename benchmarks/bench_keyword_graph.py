@@ -0,0 +1,53 @@
+"""
+키워드 관계 그래프 벤치마크 - 수십만 키워드 규모에서 이웃/경로 조회 시간 측정
+
+사용법: python benchmarks/bench_keyword_graph.py [키워드 수] [시드 수] [시드당 연관 키워드 수]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from keyword_graph import KeywordGraphStore
+
+def build_graph(store: KeywordGraphStore, keywords: int, seeds: int, fanout: int, seed: int = 0):
+    """무작위 그래프 생성 - 시드마다 fanout개의 연관 키워드 (일부는 다른 시드)"""
+    rng = random.Random(seed)
+    names = [f"키워드{i}" for i in range(keywords)]
+    seed_names = names[:seeds]
+    for source in seed_names:
+        # 연관 키워드의 10%는 다른 시드로 이어지도록 해 다단계 경로를 만듦
+        related = rng.sample(names, fanout - fanout // 10) + rng.sample(seed_names, fanout // 10)
+        store.add_edges(source, related)
+    return seed_names
+
+def timed(label: str, fn, repeat: int = 20):
+    """fn을 repeat번 실행한 평균 시간 출력"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    elapsed = (time.perf_counter() - started) / repeat * 1000
+    size = len(result) if hasattr(result, '__len__') else result
+    print(f"  {label:<28} {elapsed:8.2f} ms  (결과 {size})")
+
+if __name__ == "__main__":
+    keywords, seeds, fanout = (int(arg) for arg in (sys.argv[1:] + ["300000", "2000", "300"][len(sys.argv) - 1:])[:3])
+    with tempfile.TemporaryDirectory() as directory:
+        store = KeywordGraphStore(os.path.join(directory, "graph.sqlite3"))
+        started = time.perf_counter()
+        seed_names = build_graph(store, keywords, seeds, fanout)
+        print(f"그래프 생성 {time.perf_counter() - started:.1f}초 - {store.stats()}")
+        
+        rng = random.Random(1)
+        source, other = rng.sample(seed_names, 2)
+        target = rng.choice(store.neighbors(rng.choice(seed_names)))
+        timed("neighbors", lambda: store.neighbors(source))
+        timed("predecessors", lambda: store.predecessors(target))
+        timed("two_hop", lambda: store.two_hop(source), repeat=5)
+        timed("ancestors (2단계)", lambda: store.ancestors(target), repeat=5)
+        timed("overlap", lambda: store.overlap(source, other)['common'])
+        timed("shortest_hops", lambda: store.shortest_hops(source, target) or [])
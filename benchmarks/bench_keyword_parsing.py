@@ -0,0 +1,192 @@
+"""
+keywordList 파싱 벤치마크 - 항목별 파서 대비 컬럼 단위 파서의 처리 시간 비교
+
+사용법: python benchmarks/bench_keyword_parsing.py [행 수 ...]
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from ads_client import parse_detailed_keyword_list, parse_keyword_list_frame
+
+def parse_items_legacy(keyword_list: list) -> list:
+    """벡터화 이전의 항목별 파서 (비교 기준)"""
+    detailed_keywords = []
+    if keyword_list:
+        for item in keyword_list:
+            keyword_text = item.get('relKeyword', '').strip()
+            if not keyword_text:
+                continue
+            
+            # 기본 통계 처리
+            def process_stat(value):
+                """통계 값 처리 (문자열 및 특수 케이스 처리)"""
+                if isinstance(value, str):
+                    if "< 10" in value:
+                        return 5
+                    elif "-" in value or value == "":
+                        return 0
+                try:
+                    return int(value) if value else 0
+                except (ValueError, TypeError):
+                    return 0
+            
+            # PC 통계 - 안전한 처리
+            pc_search = process_stat(item.get('monthlyPcQcCnt', 0))
+            pc_click = process_stat(item.get('monthlyAvePcClkCnt', 0))
+            
+            # CTR 값 안전 처리
+            try:
+                pc_ctr_raw = item.get('monthlyAvePcCtr', 0.0)
+                if isinstance(pc_ctr_raw, str):
+                    pc_ctr = float(pc_ctr_raw) if pc_ctr_raw and pc_ctr_raw != '-' else 0.0
+                else:
+                    pc_ctr = float(pc_ctr_raw) if pc_ctr_raw else 0.0
+            except (ValueError, TypeError):
+                pc_ctr = 0.0
+            
+            pc_exposure = process_stat(item.get('plAvgDepth', 0))  # 광고 노출 수
+            
+            # 모바일 통계 - 안전한 처리
+            mobile_search = process_stat(item.get('monthlyMobileQcCnt', 0))
+            mobile_click = process_stat(item.get('monthlyAveMobileClkCnt', 0))
+            
+            # 모바일 CTR 값 안전 처리
+            try:
+                mobile_ctr_raw = item.get('monthlyAveMobileCtr', 0.0)
+                if isinstance(mobile_ctr_raw, str):
+                    mobile_ctr = float(mobile_ctr_raw) if mobile_ctr_raw and mobile_ctr_raw != '-' else 0.0
+                else:
+                    mobile_ctr = float(mobile_ctr_raw) if mobile_ctr_raw else 0.0
+            except (ValueError, TypeError):
+                mobile_ctr = 0.0
+            
+            mobile_exposure = process_stat(item.get('plAvgDepth', 0))  # 모바일도 동일한 필드 사용
+            
+            # 경쟁 정보 처리 개선
+            competition_index = item.get('compIdx', 'N/A')
+            
+            # 경쟁도 처리 - 문자열과 숫자 모두 처리
+            if competition_index != 'N/A' and competition_index is not None:
+                try:
+                    # 이미 문자열인 경우 그대로 사용
+                    if isinstance(competition_index, str):
+                        if competition_index in ['낮음', '보통', '높음']:
+                            competition_level = competition_index
+                            # 문자열을 숫자로 역변환 (광고수 계산용)
+                            if competition_index == '낮음':
+                                comp_idx_numeric = 20
+                            elif competition_index == '보통':
+                                comp_idx_numeric = 50
+                            else:  # '높음'
+                                comp_idx_numeric = 80
+                        else:
+                            # 숫자형 문자열인 경우
+                            comp_idx_numeric = float(competition_index)
+                            if comp_idx_numeric <= 30:
+                                competition_level = '낮음'
+                            elif comp_idx_numeric <= 70:
+                                competition_level = '보통'
+                            else:
+                                competition_level = '높음'
+                    else:
+                        # 숫자인 경우
+                        comp_idx_numeric = float(competition_index)
+                        if comp_idx_numeric <= 30:
+                            competition_level = '낮음'
+                        elif comp_idx_numeric <= 70:
+                            competition_level = '보통'
+                        else:
+                            competition_level = '높음'
+                except (ValueError, TypeError):
+                    competition_level = '알 수 없음'
+                    comp_idx_numeric = 50  # 기본값
+            else:
+                competition_level = '알 수 없음'
+                comp_idx_numeric = 50  # 기본값
+            
+            detailed_keywords.append({
+                'keyword': keyword_text,
+                # 월간 검색수
+                'monthly_pc_search': pc_search,
+                'monthly_mobile_search': mobile_search,
+                'total_monthly_search': pc_search + mobile_search,
+                
+                # 월평균 클릭수
+                'monthly_avg_pc_click': pc_click,
+                'monthly_avg_mobile_click': mobile_click,
+                'total_monthly_avg_click': pc_click + mobile_click,
+                
+                # 월평균 클릭률
+                'monthly_avg_pc_ctr': pc_ctr,
+                'monthly_avg_mobile_ctr': mobile_ctr,
+                'total_monthly_avg_ctr': (pc_ctr + mobile_ctr) / 2 if pc_ctr > 0 or mobile_ctr > 0 else 0,
+                
+                # 경쟁 정보
+                'competition_index': competition_index,
+                'competition_level': competition_level,
+                
+                # 노출 관련 (광고 깊이를 노출 수 대용으로 사용)
+                'pc_exposure': pc_exposure,
+                'mobile_exposure': mobile_exposure,
+                'total_exposure': pc_exposure + mobile_exposure,
+                
+                # 광고수 (경쟁도 기반 추정) - 안전한 처리
+                'estimated_ads_count': max(1, int(comp_idx_numeric / 10)),
+                
+                # 기타
+                'source': 'search_ads_api'
+            })
+    
+    return detailed_keywords
+
+
+def make_keyword_list(rows: int, seed: int = 0) -> list:
+    """실제 응답과 비슷한 값 분포의 keywordList 생성"""
+    rng = random.Random(seed)
+    
+    def count():
+        return rng.choice(["< 10", rng.randint(10, 500000), rng.randint(10, 5000)])
+    
+    def ctr():
+        return rng.choice([round(rng.uniform(0, 5), 2), "-", 0.0])
+    
+    return [{
+        'relKeyword': f"키워드{i}",
+        'monthlyPcQcCnt': count(),
+        'monthlyMobileQcCnt': count(),
+        'monthlyAvePcClkCnt': rng.choice([round(rng.uniform(0, 300), 1), "-"]),
+        'monthlyAveMobileClkCnt': rng.choice([round(rng.uniform(0, 3000), 1), "-"]),
+        'monthlyAvePcCtr': ctr(),
+        'monthlyAveMobileCtr': ctr(),
+        'plAvgDepth': rng.randint(0, 15),
+        'compIdx': rng.choice(['낮음', '보통', '높음'])
+    } for i in range(rows)]
+
+def bench(rows: int, repeat: int = 5):
+    """행 수 하나에 대한 항목별/컬럼 단위 파싱 시간 출력 (최솟값, ms)"""
+    keyword_list = make_keyword_list(rows)
+    
+    def legacy():
+        return pd.DataFrame(parse_items_legacy(keyword_list))
+    
+    cases = [
+        ("항목별 파싱 + DataFrame", legacy),
+        ("컬럼 단위 DataFrame", lambda: parse_keyword_list_frame(keyword_list)),
+        ("컬럼 단위 레코드", lambda: parse_detailed_keyword_list(keyword_list)),
+    ]
+    baseline = None
+    for name, fn in cases:
+        number = max(1, 2000 // rows)
+        elapsed = min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1000
+        baseline = baseline or elapsed
+        print(f"{rows:>7,}행  {name:<22} {elapsed:8.2f} ms  (x{baseline / elapsed:.1f})")
+
+if __name__ == "__main__":
+    for rows in [int(arg) for arg in sys.argv[1:]] or [100, 1000, 10000]:
+        bench(rows)
@@ -0,0 +1,125 @@
+"""
+Cache module for the marketing tool
+SQLite 기반 디스크 캐시 (항목별 TTL, 크기 제한 LRU 제거, 적중/실패 집계)
+"""
+
+import os
+import sqlite3
+import time
+from datetime import datetime
+from config import KST, CacheConfig
+from sqlite_store import SQLiteStore
+
+class DiskCache(SQLiteStore):
+    """프로세스 간에 공유되는 SQLite 키-값 캐시
+
+    각 항목은 만료 시각을 가지며, 항목 수가 max_entries를 넘으면
+    가장 오래 사용되지 않은 항목부터 제거한다.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            key TEXT PRIMARY KEY,
+            value BLOB NOT NULL,
+            expires_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at);
+    """
+    SYNCHRONOUS = "NORMAL"
+    
+    def __init__(self, path: str, max_entries: int, default_ttl: float):
+        super().__init__(path)
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: str):
+        """캐시 값 조회 (없거나 만료되었으면 None)"""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT value, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None or row[1] <= now:
+                if row is not None:
+                    conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+            conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+    
+    def set(self, key: str, value: bytes, ttl: float = None, expires_at: float = None):
+        """캐시 값 저장 (ttl 또는 절대 만료 시각 expires_at 지정)"""
+        now = time.time()
+        if expires_at is None:
+            expires_at = now + (self.default_ttl if ttl is None else ttl)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, now)
+            )
+            self._evict(conn)
+    
+    def _evict(self, conn: sqlite3.Connection):
+        """만료 항목 정리 후 최대 항목 수를 넘는 만큼 LRU 제거"""
+        count = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        if count <= self.max_entries:
+            return
+        conn.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+        overflow = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM entries WHERE key IN "
+                "(SELECT key FROM entries ORDER BY accessed_at LIMIT ?)",
+                (overflow,)
+            )
+    
+    def delete(self, key: str):
+        """캐시 항목 삭제"""
+        with self._lock:
+            self._connect().execute("DELETE FROM entries WHERE key = ?", (key,))
+    
+    def clear(self):
+        """모든 캐시 항목 삭제 및 집계 초기화"""
+        with self._lock:
+            self._connect().execute("DELETE FROM entries")
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self) -> dict:
+        """캐시 적중/실패 집계 및 저장된 항목 수"""
+        with self._lock:
+            entries = self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            'entries': entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+# 네이버 쇼핑 검색 결과 페이지 캐시 (query, display, start 단위)
+serp_cache = DiskCache(
+    os.path.join(CacheConfig.CACHE_DIR, "serp_cache.sqlite3"),
+    max_entries=CacheConfig.SERP_CACHE_MAX_ENTRIES,
+    default_ttl=CacheConfig.SERP_CACHE_TTL
+)
+
+def next_monthly_refresh(now: float = None) -> float:
+    """다음 월간 통계 갱신 시각 (매월 KEYWORD_STATS_REFRESH_DAY일 0시, KST)"""
+    current = datetime.fromtimestamp(now or time.time(), KST)
+    refresh = current.replace(day=CacheConfig.KEYWORD_STATS_REFRESH_DAY, hour=0, minute=0, second=0, microsecond=0)
+    if refresh <= current:
+        year, month = (current.year + 1, 1) if current.month == 12 else (current.year, current.month + 1)
+        refresh = refresh.replace(year=year, month=month)
+    return refresh.timestamp()
+
+# 검색광고 키워드 상세 통계 캐시 (시드 키워드 단위, 월간 갱신 시점에 만료)
+keyword_stats_cache = DiskCache(
+    os.path.join(CacheConfig.CACHE_DIR, "keyword_stats_cache.sqlite3"),
+    max_entries=CacheConfig.KEYWORD_STATS_CACHE_MAX_ENTRIES,
+    default_ttl=30 * 24 * 60 * 60
+)
@@ -0,0 +1,194 @@
+"""
+Batch CLI for the marketing tool
+CSV/JSONL의 (키워드, 판매처) 목록을 Streamlit 없이 대량으로 순위 확인
+
+사용 예:
+    python cli.py pairs.csv -o results.jsonl --workers 8
+    python cli.py pairs.jsonl -o results.csv --all --history
+
+입력 파일은 keyword, mall 컬럼(또는 키)을 가져야 하며 mall 대신 mall_name도 허용한다.
+출력 파일이 이미 있으면 완료된 쌍은 건너뛰고 이어서 진행한다.
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime
+from api import iter_malls_products
+from config import RateLimitConfig
+from history import rank_history
+from scheduler import run_keyword_tasks
+
+logger = logging.getLogger("cli")
+
+OUTPUT_FIELDS = ["keyword", "mall_name", "rank", "product_id", "title", "price", "link", "matched_mall", "checked_at"]
+
+def _detect_format(path: str, override: str = None) -> str:
+    """파일 형식 결정 (--format 지정값 또는 확장자)"""
+    if override:
+        return override
+    return "jsonl" if path.lower().endswith((".jsonl", ".ndjson", ".json")) else "csv"
+
+def read_pairs(path: str, file_format: str = None) -> list:
+    """입력 파일에서 (키워드, 판매처명) 목록을 순서대로 중복 없이 읽음"""
+    file_format = _detect_format(path, file_format)
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        if file_format == "jsonl":
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            rows = list(csv.DictReader(f))
+    
+    pairs = []
+    for row in rows:
+        keyword = (row.get("keyword") or "").strip()
+        mall_name = (row.get("mall") or row.get("mall_name") or "").strip()
+        if keyword and mall_name:
+            pairs.append((keyword, mall_name))
+    return list(dict.fromkeys(pairs))
+
+def read_completed_pairs(path: str, file_format: str) -> set:
+    """기존 출력 파일에서 이미 완료된 (키워드, 판매처명) 집합 (재개용)"""
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        if file_format == "jsonl":
+            rows = []
+            for line in f:
+                try:
+                    rows.append(json.loads(line))
+                except ValueError:
+                    # 중단 시 잘린 마지막 줄은 무시
+                    continue
+        else:
+            rows = list(csv.DictReader(f))
+    return {(row.get("keyword"), row.get("mall_name")) for row in rows}
+
+class ResultWriter:
+    """결과를 완료되는 즉시 한 줄씩 기록하고 flush하는 CSV/JSONL 작성기"""
+    
+    def __init__(self, path: str, file_format: str):
+        self.file_format = file_format
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, "a", encoding="utf-8", newline="")
+        self._csv = None
+        if file_format == "csv":
+            self._csv = csv.DictWriter(self._file, fieldnames=OUTPUT_FIELDS)
+            if is_new:
+                self._csv.writeheader()
+    
+    def write(self, row: dict):
+        if self._csv is not None:
+            self._csv.writerow(row)
+        else:
+            self._file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self._file.flush()
+    
+    def close(self):
+        self._file.close()
+
+def _result_rows(keyword: str, mall_name: str, records: list, checked_at: str) -> list:
+    """판매처 하나의 결과를 출력 행으로 변환 (없으면 순위가 빈 행 하나)"""
+    if not records:
+        return [{"keyword": keyword, "mall_name": mall_name, "rank": None, "product_id": None, "title": None,
+                 "price": None, "link": None, "matched_mall": None, "checked_at": checked_at}]
+    return [{
+        "keyword": keyword,
+        "mall_name": mall_name,
+        "rank": record.rank,
+        "product_id": record.product_id,
+        "title": record.title,
+        "price": record.price,
+        "link": record.link,
+        "matched_mall": record.mall_name,
+        "checked_at": checked_at
+    } for record in records]
+
+def run_batch(pairs: list, output_path: str, output_format: str, workers: int = None,
+              collect_all: bool = False, save_history: bool = False) -> dict:
+    """(키워드, 판매처) 목록을 키워드 단위로 묶어 동시에 처리하고 결과를 스트리밍 기록"""
+    completed = read_completed_pairs(output_path, output_format)
+    remaining = [pair for pair in pairs if pair not in completed]
+    
+    # 같은 키워드의 판매처들은 한 번의 크롤링으로 함께 확인
+    malls_by_keyword = {}
+    for keyword, mall_name in remaining:
+        malls_by_keyword.setdefault(keyword, []).append(mall_name)
+    
+    logger.info("전체 %d쌍 중 %d쌍 완료됨, %d쌍(%d개 키워드) 처리 시작",
+                len(pairs), len(pairs) - len(remaining), len(remaining), len(malls_by_keyword))
+    
+    def scan_keyword(keyword):
+        results = {name: [] for name in malls_by_keyword[keyword]}
+        for name, record in iter_malls_products(keyword, malls_by_keyword[keyword], collect_all=collect_all):
+            results[name].append(record)
+        return results
+    
+    summary = {"keywords": 0, "pairs": 0, "found": 0, "failed": 0}
+    writer = ResultWriter(output_path, output_format)
+    started = time.monotonic()
+    try:
+        for keyword, results, error in run_keyword_tasks(list(malls_by_keyword), scan_keyword, max_workers=workers):
+            summary["keywords"] += 1
+            if error:
+                # 실패한 키워드는 기록하지 않으므로 다시 실행하면 재시도됨
+                summary["failed"] += len(malls_by_keyword[keyword])
+                logger.warning("'%s' 실패: %s", keyword, error)
+                continue
+            
+            checked_at = datetime.now().astimezone().isoformat(timespec="seconds")
+            for mall_name, records in results.items():
+                for row in _result_rows(keyword, mall_name, records, checked_at):
+                    writer.write(row)
+                summary["pairs"] += 1
+                summary["found"] += bool(records)
+            
+            if save_history:
+                rank_history.record_many([
+                    (keyword, mall_name, records[0].to_dict() if records else None)
+                    for mall_name, records in results.items()
+                ])
+            
+            logger.info("[%d/%d] '%s' 완료 (%.1f초 경과)",
+                        summary["keywords"], len(malls_by_keyword), keyword, time.monotonic() - started)
+    finally:
+        writer.close()
+    
+    return summary
+
+def main(argv: list = None) -> int:
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description="키워드/판매처 대량 순위 확인 (헤드리스)")
+    parser.add_argument("input", help="keyword, mall 컬럼을 가진 CSV 또는 JSONL 파일")
+    parser.add_argument("-o", "--output", required=True, help="결과 파일 (CSV 또는 JSONL, 있으면 이어서 진행)")
+    parser.add_argument("--input-format", choices=["csv", "jsonl"], help="입력 형식 (기본: 확장자로 판단)")
+    parser.add_argument("--output-format", choices=["csv", "jsonl"], help="출력 형식 (기본: 확장자로 판단)")
+    parser.add_argument("--workers", type=int, default=RateLimitConfig.MAX_KEYWORD_WORKERS, help="동시에 처리할 키워드 수")
+    parser.add_argument("--all", action="store_true", help="최고 순위뿐 아니라 모든 노출 상품 기록")
+    parser.add_argument("--history", action="store_true", help="결과를 순위 이력 저장소에도 기록")
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    
+    pairs = read_pairs(args.input, args.input_format)
+    if not pairs:
+        logger.error("입력 파일에서 (keyword, mall) 쌍을 찾지 못했습니다.")
+        return 1
+    
+    summary = run_batch(
+        pairs,
+        args.output,
+        _detect_format(args.output, args.output_format),
+        workers=args.workers,
+        collect_all=args.all,
+        save_history=args.history
+    )
+    logger.info("완료: 키워드 %d개, 쌍 %d개 (발견 %d), 실패 %d쌍",
+                summary["keywords"], summary["pairs"], summary["found"], summary["failed"])
+    return 1 if summary["failed"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,11 +4,15 @@ Configuration file for the marketing tool
 """
 
 import os
+from datetime import timedelta, timezone
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# 네이버 API 일일 한도 초기화와 월간 통계 갱신의 기준 시간대 (한국 표준시)
+KST = timezone(timedelta(hours=9))
+
 # API 설정
 class APIConfig:
     """API 관련 설정"""
@@ -54,6 +58,9 @@ class AppConfig:
     MAX_KEYWORDS = 10
     MAX_SEARCH_RESULTS = 1000
     RESULTS_PER_PAGE = 100
+    MAX_FETCH_WORKERS = 10  # 병렬 페이지 조회 시 최대 동시 요청 수
+    RECHECK_PROBE_PAGES = 3  # 증분 재확인 시 이전 순위 주변에서 먼저 조회할 페이지 수
+    MAX_HINT_KEYWORDS = 5  # keywordstool 호출 하나에 묶어 보낼 최대 시드 키워드 수
     
     # 차트 설정
     MAX_CHART_ITEMS = 20
@@ -61,6 +68,102 @@ class AppConfig:
     # 기타 설정
     COPYRIGHT_TEXT = "ⓒ 2025 쇼쇼. 무단 복제 및 배포 금지. All rights reserved."
 
+# 네트워크 설정
+class NetworkConfig:
+    """HTTP 전송 관련 설정"""
+    
+    CONNECT_TIMEOUT = 5  # 연결 타임아웃 (초)
+    READ_TIMEOUT = 30  # 응답 읽기 타임아웃 (초)
+    MAX_IDLE_CONNECTIONS_PER_HOST = 10  # 호스트별 유지할 keep-alive 연결 수
+    
+    # 재시도 설정 (429/5xx 및 연결 오류)
+    RETRY_MAX_ATTEMPTS = 4  # 최초 요청 포함 최대 시도 횟수
+    RETRY_BASE_DELAY = 0.5  # 지수 백오프 기본 대기 시간 (초)
+    RETRY_MAX_DELAY = 10  # 백오프 최대 대기 시간 (초)
+    RETRY_AFTER_MAX = 60  # Retry-After 헤더를 따를 최대 대기 시간 (초)
+    RETRY_BUDGET_PER_KEYWORD = 10  # 키워드 하나의 스캔에서 허용할 총 재시도 횟수
+    
+    # 동일한 요청(URL)이 동시에 진행 중이면 업스트림 호출 하나의 결과를 공유
+    COALESCE_REQUESTS = True
+    
+    # 응답 JSON 디코더 ("auto": orjson이 설치되어 있으면 사용, 없으면 표준 json / "orjson" / "json")
+    JSON_BACKEND = os.getenv("JSON_BACKEND", "auto")
+
+# 데이터 저장 설정
+class StorageConfig:
+    """영구 데이터 저장 관련 설정"""
+    
+    DATA_DIR = os.getenv("DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".data"))
+    
+    # 순위 히스토리 차트 기본 조회 기간 (일)
+    HISTORY_DEFAULT_DAYS = 90
+    
+    # 검색광고 조회 결과의 (시드 → 연관 키워드) 관계를 키워드 그래프에 기록
+    KEYWORD_GRAPH_ENABLED = True
+
+# 백그라운드 순위 추적 설정
+class TrackerConfig:
+    """관심 키워드 자동 순위 추적 관련 설정"""
+    
+    DEFAULT_INTERVAL_MINUTES = 360  # 기본 재확인 주기 (분)
+    POLL_SECONDS = 60  # 재확인 대상 확인 주기 (초)
+    
+    # 증분 재확인 - 이전 순위 위치부터 조회하고, 최고 순위 확정 스캔은 주기적으로만 수행
+    INCREMENTAL_RECHECK = True
+    FULL_RESCAN_HOURS = 24
+
+# 백그라운드 작업 큐 설정
+class JobConfig:
+    """제출 후 조회(submit-and-poll) 작업 큐 관련 설정"""
+    
+    MAX_JOB_KEYWORDS = 1000  # 백그라운드 작업 하나에 넣을 수 있는 최대 키워드 수
+    WORKERS = 2  # 프로세스당 작업 처리 스레드 수
+    POLL_SECONDS = 1.0  # 처리할 항목이 없을 때 대기 시간 (초)
+    STALE_SECONDS = 600  # 이 시간 이상 처리 중인 항목은 중단된 것으로 보고 다시 대기열에 넣음 (초)
+    RECENT_JOBS = 10  # 페이지에 표시할 최근 작업 수
+
+# 연관 키워드 확장 탐색 설정
+class ExpansionConfig:
+    """연관 키워드 확장(스노우볼) 탐색 관련 설정"""
+    
+    DEFAULT_DEPTH = 2  # 기본 탐색 깊이 (시드에서 몇 단계까지 확장할지)
+    MAX_DEPTH = 4
+    DEFAULT_CALL_BUDGET = 30  # 탐색 한 번에 사용할 기본 keywordstool 호출 수
+    MAX_CALL_BUDGET = 300
+    WORKERS = 4  # 동시에 확장할 키워드 수
+
+# 캐시 설정
+class CacheConfig:
+    """디스크 캐시 관련 설정"""
+    
+    CACHE_ENABLED = True
+    CACHE_DIR = os.getenv("CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+    
+    # 쇼핑 검색 결과 페이지 캐시
+    SERP_CACHE_TTL = 600  # 유효 시간 (초)
+    SERP_CACHE_MAX_ENTRIES = 5000  # 최대 저장 페이지 수
+    
+    # 검색광고 키워드 통계 캐시 (월간 통계이므로 다음 갱신 시점까지 유지)
+    KEYWORD_STATS_CACHE_MAX_ENTRIES = 20000  # 최대 저장 시드 키워드 수
+    KEYWORD_STATS_REFRESH_DAY = 1  # 월간 통계가 갱신되는 날짜 (매월, KST 0시 기준)
+
+# API 호출 제한 설정
+class RateLimitConfig:
+    """API 호출 속도 제한 관련 설정"""
+    
+    # 네이버 쇼핑 검색 API (초당 호출 수 / 순간 최대 호출 수)
+    SHOPPING_CALLS_PER_SECOND = 10
+    SHOPPING_BURST = 10
+    SHOPPING_DAILY_QUOTA = int(os.getenv("SHOPPING_DAILY_QUOTA", "25000"))
+    
+    # 네이버 검색광고 API
+    ADS_CALLS_PER_SECOND = 5
+    ADS_BURST = 5
+    ADS_DAILY_QUOTA = int(os.getenv("ADS_DAILY_QUOTA", "100000"))
+    
+    # 동시에 처리할 최대 키워드 수
+    MAX_KEYWORD_WORKERS = 4
+
 # 디버그 설정
 class DebugConfig:
     """디버그 관련 설정"""
@@ -0,0 +1,96 @@
+"""
+Keyword expansion module for the marketing tool
+시드 키워드에서 연관 키워드를 너비 우선으로 반복 확장하는 스노우볼 탐색
+"""
+
+import logging
+from ads_client import ads_client
+from config import ExpansionConfig
+from keyword_graph import normalize_keyword
+from scheduler import run_keyword_tasks
+
+logger = logging.getLogger(__name__)
+
+def expand_keywords(seed: str, max_depth: int = None, max_calls: int = None, max_workers: int = None,
+                    refresh: bool = False, on_progress=None) -> dict:
+    """시드 키워드에서 연관 키워드를 너비 우선으로 확장
+
+    각 단계에서 새로 발견한 키워드를 다시 hintKeywords로 넣어 다음 단계를 조회하며,
+    max_depth 단계까지 또는 max_calls 회의 API 호출을 다 쓰고 캐시에도 없는 키워드만
+    남으면 멈춘다. 캐시에 있는 키워드는 호출 예산을 쓰지 않고 확장한다. 키워드는
+    검색광고 API와 같은 기준(공백 제거, 대문자)으로 전체에서 한 번만 기록되고, 호출
+    예산이 부족하면 검색량이 많은 키워드부터 조회한다. 연관 키워드의 출처를 정확히
+    남기기 위해 한 번의 호출에는 키워드 하나만 넣는다.
+
+    반환값: {
+        'keywords': [상세 통계 레코드 + depth(시드로부터의 거리), parent(처음 발견한 확장 키워드)],
+        'edges': [(확장 키워드, 연관 키워드)],
+        'calls': 실제로 보낸 API 호출 수,
+        'cache_hits': 캐시로 확장한 키워드 수,
+        'errors': {확장 키워드: 예외}
+    }
+    on_progress(depth, calls, 발견 키워드 수)는 단계마다 호출된다.
+    """
+    max_depth = max(0, min(max_depth if max_depth is not None else ExpansionConfig.DEFAULT_DEPTH,
+                           ExpansionConfig.MAX_DEPTH))
+    max_calls = max(0, min(max_calls if max_calls is not None else ExpansionConfig.DEFAULT_CALL_BUDGET,
+                           ExpansionConfig.MAX_CALL_BUDGET))
+    
+    seed = seed.strip()
+    discovered = {normalize_keyword(seed): {'keyword': seed, 'depth': 0, 'parent': None}}
+    edges = []
+    errors = {}
+    calls = 0
+    cache_hits = 0
+    frontier = [seed]
+    
+    for depth in range(max_depth):
+        # 캐시에 있는 키워드는 바로 확장하고, 없는 키워드만 남은 호출 예산만큼 조회
+        results = {}
+        to_fetch = []
+        for hint in frontier:
+            records = None if refresh else ads_client.cached_keyword_stats(hint)
+            if records is not None:
+                results[hint] = (records, None)
+            elif len(to_fetch) < max_calls - calls:
+                to_fetch.append(hint)
+        cache_hits += len(results)
+        
+        # 동시에 조회하되 결과는 확장 순서대로 반영해 parent가 실행 순서에 따라 달라지지 않게 함
+        # (캐시는 위에서 이미 확인했으므로 refresh=True로 바로 API 호출)
+        for hint, records, error in run_keyword_tasks(to_fetch, lambda k: ads_client.keyword_stats(k, refresh=True),
+                                                      max_workers=max_workers or ExpansionConfig.WORKERS):
+            results[hint] = (records, error)
+        calls += len(to_fetch)
+        
+        batch = [hint for hint in frontier if hint in results]
+        if not batch:
+            break
+        
+        next_frontier = []
+        for hint in batch:
+            records, error = results[hint]
+            if error:
+                logger.warning("'%s' 확장 실패: %s", hint, error)
+                errors[hint] = error
+                continue
+            hint_key = normalize_keyword(hint)
+            for record in records:
+                key = normalize_keyword(record['keyword'])
+                if key == hint_key:
+                    # 확장 키워드 자신의 통계 행 (발견 당시 통계가 없던 시드 등에 채움)
+                    known = discovered[key]
+                    discovered[key] = dict(record, keyword=known['keyword'], depth=known['depth'], parent=known['parent'])
+                    continue
+                edges.append((hint, record['keyword']))
+                if key not in discovered:
+                    discovered[key] = dict(record, depth=depth + 1, parent=hint)
+                    next_frontier.append(record['keyword'])
+        
+        frontier = sorted(next_frontier, key=lambda k: discovered[normalize_keyword(k)]['total_monthly_search'],
+                          reverse=True)
+        if on_progress:
+            on_progress(depth + 1, calls, len(discovered))
+    
+    keywords = sorted(discovered.values(), key=lambda r: (r['depth'], -r.get('total_monthly_search', 0)))
+    return {'keywords': keywords, 'edges': edges, 'calls': calls, 'cache_hits': cache_hits, 'errors': errors}
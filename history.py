@@ -0,0 +1,99 @@
+"""
+Rank history module for the marketing tool
+순위 확인 결과를 SQLite에 저장하고 기간별 추이를 조회
+"""
+
+import os
+import time
+import pandas as pd
+from config import StorageConfig
+from sqlite_store import SQLiteStore
+
+class RankHistoryStore(SQLiteStore):
+    """(키워드, 판매처, 상품ID, 순위, 가격, 확인 시각) 이력 저장소
+
+    (keyword, mall_name, checked_at) 인덱스로 "키워드 X / 판매처 Y의 최근 90일" 같은
+    시계열 조회를 빠르게 처리한다. 순위권 밖이면 rank가 NULL로 기록된다.
+    증분 재확인처럼 판매처 최고 순위가 확정되지 않은 결과는 proven=0으로 구분한다.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS rank_history (
+            id INTEGER PRIMARY KEY,
+            keyword TEXT NOT NULL,
+            mall_name TEXT NOT NULL,
+            product_id TEXT,
+            rank INTEGER,
+            price INTEGER,
+            title TEXT,
+            checked_at REAL NOT NULL,
+            proven INTEGER NOT NULL DEFAULT 1
+        );
+        CREATE INDEX IF NOT EXISTS idx_rank_history_lookup ON rank_history (keyword, mall_name, checked_at);
+    """
+    
+    def record(self, keyword: str, mall_name: str, product: dict = None, checked_at: float = None):
+        """순위 확인 결과 한 건 저장 (product가 None이면 순위권 밖으로 기록)"""
+        self.record_many([(keyword, mall_name, product)], checked_at=checked_at)
+    
+    def record_many(self, results: list, checked_at: float = None):
+        """[(키워드, 판매처명, 상품 딕셔너리 또는 None), ...] 을 한 트랜잭션으로 저장
+
+        상품 딕셔너리에 'proven': False가 있으면 확정되지 않은 순위로 기록한다.
+        """
+        checked_at = checked_at or time.time()
+        rows = []
+        for keyword, mall_name, product in results:
+            if product:
+                rows.append((keyword, mall_name, product.get('productId'), int(product['rank']),
+                             int(product['price']), product.get('title'), checked_at,
+                             bool(product.get('proven', True))))
+            else:
+                rows.append((keyword, mall_name, None, None, None, None, checked_at, True))
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("BEGIN")
+                conn.executemany(
+                    "INSERT INTO rank_history "
+                    "(keyword, mall_name, product_id, rank, price, title, checked_at, proven) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+    
+    def query(self, keyword: str, mall_name: str, days: int = 90) -> pd.DataFrame:
+        """키워드/판매처의 최근 days일 이력 (시간순)"""
+        since = time.time() - days * 24 * 60 * 60
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT checked_at, rank, price, product_id, title, proven FROM rank_history "
+                "WHERE keyword = ? AND mall_name = ? AND checked_at >= ? ORDER BY checked_at",
+                (keyword, mall_name, since)
+            ).fetchall()
+        df = pd.DataFrame(rows, columns=['checked_at', 'rank', 'price', 'product_id', 'title', 'proven'])
+        df['checked_at'] = pd.to_datetime(df['checked_at'], unit='s', utc=True).dt.tz_convert('Asia/Seoul')
+        return df.astype({'rank': 'Int32', 'price': 'Int64', 'proven': 'bool'})
+    
+    def last_result(self, keyword: str, mall_name: str):
+        """키워드/판매처의 가장 최근 확인 결과 (기록이 없으면 None)"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT rank, price, product_id, title, checked_at, proven FROM rank_history "
+                "WHERE keyword = ? AND mall_name = ? ORDER BY checked_at DESC LIMIT 1",
+                (keyword, mall_name)
+            ).fetchone()
+        if row is None:
+            return None
+        return {'rank': row[0], 'price': row[1], 'productId': row[2], 'title': row[3], 'checked_at': row[4],
+                'proven': bool(row[5])}
+    
+    def tracked_pairs(self) -> list:
+        """이력이 있는 (키워드, 판매처명) 목록 (최근 확인 순)"""
+        with self._lock:
+            return self._connect().execute(
+                "SELECT keyword, mall_name FROM rank_history "
+                "GROUP BY keyword, mall_name ORDER BY MAX(checked_at) DESC"
+            ).fetchall()
+
+# 순위 이력 기본 저장소
+rank_history = RankHistoryStore(os.path.join(StorageConfig.DATA_DIR, "rank_history.sqlite3"))
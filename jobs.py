@@ -0,0 +1,224 @@
+"""
+Job queue module for the marketing tool
+SQLite 기반 영구 작업 큐 - 페이지는 작업을 제출하고 상태/부분 결과를 조회하며,
+백그라운드 워커 스레드가 키워드 단위로 처리한다.
+
+작업과 결과가 디스크에 저장되므로 Streamlit 재실행, 페이지 이동, 브라우저 새로고침,
+서버 재시작 후에도 작업이 이어진다.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from api import iter_malls_products
+from config import JobConfig, StorageConfig
+from history import rank_history
+from sqlite_store import SQLiteStore
+
+logger = logging.getLogger("jobs")
+
+def _run_rank_item(keyword: str, params: dict):
+    """순위 확인 작업 항목 - {판매처명: 최고 순위 상품 또는 None}"""
+    mall_names = params['mall_names']
+    best = {name: None for name in mall_names}
+    for name, record in iter_malls_products(keyword, mall_names):
+        best[name] = record.to_dict()
+    rank_history.record_many([(keyword, name, product) for name, product in best.items()])
+    return best
+
+# 작업 종류별 항목 처리 함수
+JOB_HANDLERS = {
+    'rank': _run_rank_item,
+}
+
+class JobQueue(SQLiteStore):
+    """작업(job)과 키워드별 항목(item)을 저장하는 작업 큐"""
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            owner TEXT,
+            params TEXT NOT NULL,
+            total INTEGER NOT NULL,
+            created_at REAL NOT NULL,
+            cancelled INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS job_items (
+            job_id TEXT NOT NULL,
+            idx INTEGER NOT NULL,
+            keyword TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            result TEXT,
+            error TEXT,
+            updated_at REAL,
+            PRIMARY KEY (job_id, idx)
+        );
+        CREATE INDEX IF NOT EXISTS idx_job_items_status ON job_items (status, updated_at);
+        CREATE INDEX IF NOT EXISTS idx_jobs_owner ON jobs (owner, created_at);
+    """
+    
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._workers = []
+    
+    def submit(self, kind: str, keywords: list, params: dict = None, owner: str = None) -> str:
+        """작업 제출 후 작업 ID 반환"""
+        if kind not in JOB_HANDLERS:
+            raise ValueError(f"알 수 없는 작업 종류: {kind}")
+        job_id = uuid.uuid4().hex[:12]
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("BEGIN")
+                conn.execute(
+                    "INSERT INTO jobs (id, kind, owner, params, total, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (job_id, kind, owner, json.dumps(params or {}, ensure_ascii=False), len(keywords), now)
+                )
+                conn.executemany(
+                    "INSERT INTO job_items (job_id, idx, keyword, updated_at) VALUES (?, ?, ?, ?)",
+                    [(job_id, idx, keyword, now) for idx, keyword in enumerate(keywords)]
+                )
+        self.start_workers()
+        return job_id
+    
+    def cancel(self, job_id: str):
+        """대기 중인 항목 취소 (처리 중인 항목은 끝까지 진행)"""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("BEGIN")
+                conn.execute("UPDATE jobs SET cancelled = 1 WHERE id = ?", (job_id,))
+                conn.execute(
+                    "UPDATE job_items SET status = 'cancelled', updated_at = ? WHERE job_id = ? AND status = 'pending'",
+                    (time.time(), job_id)
+                )
+    
+    def status(self, job_id: str):
+        """작업 상태 요약 (없으면 None)"""
+        with self._lock:
+            conn = self._connect()
+            job = conn.execute(
+                "SELECT kind, owner, params, total, created_at, cancelled FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if job is None:
+                return None
+            counts = dict(conn.execute(
+                "SELECT status, COUNT(*) FROM job_items WHERE job_id = ? GROUP BY status", (job_id,)
+            ).fetchall())
+        
+        finished = counts.get('done', 0) + counts.get('failed', 0) + counts.get('cancelled', 0)
+        if finished >= job[3]:
+            state = 'cancelled' if job[5] else 'finished'
+        elif counts.get('running') or finished:
+            state = 'running'
+        else:
+            state = 'pending'
+        return {
+            'id': job_id,
+            'kind': job[0],
+            'owner': job[1],
+            'params': json.loads(job[2]),
+            'total': job[3],
+            'created_at': job[4],
+            'state': state,
+            'done': counts.get('done', 0),
+            'failed': counts.get('failed', 0),
+            'pending': counts.get('pending', 0) + counts.get('running', 0),
+        }
+    
+    def results(self, job_id: str) -> list:
+        """완료/실패한 항목의 (키워드, 결과, 오류) 목록 - 진행 중에도 부분 결과 조회 가능"""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT keyword, result, error FROM job_items "
+                "WHERE job_id = ? AND status IN ('done', 'failed') ORDER BY idx",
+                (job_id,)
+            ).fetchall()
+        return [(keyword, json.loads(result) if result else None, error) for keyword, result, error in rows]
+    
+    def recent_jobs(self, owner: str = None, limit: int = None) -> list:
+        """최근 제출된 작업 상태 목록"""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT id FROM jobs WHERE owner IS ? ORDER BY created_at DESC LIMIT ?",
+                (owner, limit or JobConfig.RECENT_JOBS)
+            ).fetchall()
+        return [self.status(row[0]) for row in rows]
+    
+    def _claim(self):
+        """대기 중인 항목 하나를 처리 중으로 표시하고 반환 (없으면 None)
+
+        중단된 프로세스가 남긴 오래된 처리 중 항목도 다시 가져온다.
+        BEGIN IMMEDIATE로 여러 프로세스의 워커가 같은 항목을 가져가지 않도록 한다.
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute(
+                    "SELECT job_id, idx, keyword FROM job_items "
+                    "WHERE status = 'pending' OR (status = 'running' AND updated_at < ?) "
+                    "ORDER BY updated_at LIMIT 1",
+                    (now - JobConfig.STALE_SECONDS,)
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE job_items SET status = 'running', updated_at = ? WHERE job_id = ? AND idx = ?",
+                    (now, row[0], row[1])
+                )
+                job = conn.execute("SELECT kind, params FROM jobs WHERE id = ?", (row[0],)).fetchone()
+        return row[0], row[1], row[2], job[0], json.loads(job[1])
+    
+    def _complete(self, job_id: str, idx: int, result=None, error: str = None):
+        """항목 처리 결과 저장"""
+        with self._lock:
+            self._connect().execute(
+                "UPDATE job_items SET status = ?, result = ?, error = ?, updated_at = ? WHERE job_id = ? AND idx = ?",
+                ('failed' if error else 'done',
+                 None if error else json.dumps(result, ensure_ascii=False),
+                 error, time.time(), job_id, idx)
+            )
+    
+    def process_next(self) -> bool:
+        """대기 중인 항목 하나를 처리 (처리할 항목이 없으면 False)"""
+        claimed = self._claim()
+        if claimed is None:
+            return False
+        job_id, idx, keyword, kind, params = claimed
+        try:
+            result = JOB_HANDLERS[kind](keyword, params)
+        except Exception as e:
+            logger.warning("작업 %s '%s' 실패: %s", job_id, keyword, e)
+            self._complete(job_id, idx, error=str(e))
+        else:
+            self._complete(job_id, idx, result=result)
+        return True
+    
+    def _worker_loop(self):
+        while True:
+            try:
+                if not self.process_next():
+                    time.sleep(JobConfig.POLL_SECONDS)
+            except Exception:
+                logger.exception("작업 워커 오류")
+                time.sleep(JobConfig.POLL_SECONDS)
+    
+    def start_workers(self, count: int = None):
+        """프로세스당 한 번 백그라운드 워커 스레드 시작 (Streamlit 재실행과 무관하게 유지됨)"""
+        with self._lock:
+            if self._workers:
+                return
+            for i in range(count or JobConfig.WORKERS):
+                worker = threading.Thread(target=self._worker_loop, name=f"job-worker-{i}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+# 기본 작업 큐
+job_queue = JobQueue(os.path.join(StorageConfig.DATA_DIR, "jobs.sqlite3"))
@@ -0,0 +1,40 @@
+"""
+JSON decoding module for the marketing tool
+API 응답 본문(bytes)을 빠른 JSON 백엔드가 설치되어 있으면 그것으로, 없으면 표준 json으로 디코딩
+"""
+
+import json
+from config import NetworkConfig
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 - 없으면 표준 json 사용
+    orjson = None
+
+def _loads_stdlib(data):
+    """표준 json 디코딩 (bytes를 받으면 인코딩을 감지해 내부에서 한 번 문자열로 변환)"""
+    return json.loads(data)
+
+# 사용 가능한 디코더 (빠른 순서)
+BACKENDS = {}
+if orjson is not None:
+    BACKENDS['orjson'] = orjson.loads  # bytes를 문자열 복사 없이 바로 디코딩
+BACKENDS['json'] = _loads_stdlib
+
+def set_backend(name: str = "auto") -> str:
+    """사용할 JSON 백엔드 선택 ("auto"면 설치된 것 중 가장 빠른 것), 선택된 이름 반환
+
+    디코딩 오류는 어느 백엔드든 json.JSONDecodeError(ValueError)로 전달된다.
+    """
+    global backend, loads
+    if name == "auto":
+        name = next(iter(BACKENDS))
+    if name not in BACKENDS:
+        raise ValueError(f"사용할 수 없는 JSON 백엔드: {name} (사용 가능: {', '.join(BACKENDS)})")
+    backend = name
+    loads = BACKENDS[name]
+    return name
+
+backend = None
+loads = _loads_stdlib
+set_backend(NetworkConfig.JSON_BACKEND)
@@ -0,0 +1,219 @@
+"""
+Keyword graph module for the marketing tool
+검색광고 API에서 얻은 (시드 → 연관 키워드) 관계를 SQLite 그래프로 저장하고 이웃/경로 조회
+"""
+
+import json
+import os
+import sqlite3
+import time
+from config import StorageConfig
+from sqlite_store import SQLiteStore
+
+def normalize_keyword(keyword: str) -> str:
+    """키워드 비교용 정규화 (검색광고 API는 공백 없이 대문자로 반환)"""
+    return "".join(keyword.split()).upper()
+
+class KeywordGraphStore(SQLiteStore):
+    """키워드 관계 그래프 저장소
+
+    키워드는 정규화한 문자열 기준으로 정수 ID에 한 번만 저장(intern)하고, 관계는
+    (src, dst) 정수 쌍만 WITHOUT ROWID 테이블에 저장한다. 기본 키가 정방향 인접 목록,
+    (dst, src) 인덱스가 역방향 인접 목록 역할을 하므로 이웃 조회는 인덱스 범위 탐색
+    한 번으로 끝나고, 다단계 조회는 단계마다 한 번의 질의로 처리한다.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS keywords (
+            id INTEGER PRIMARY KEY,
+            norm TEXT NOT NULL UNIQUE,
+            keyword TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS edges (
+            src INTEGER NOT NULL,
+            dst INTEGER NOT NULL,
+            updated_at REAL NOT NULL,
+            PRIMARY KEY (src, dst)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_edges_reverse ON edges (dst, src);
+    """
+    SYNCHRONOUS = "NORMAL"
+    
+    @staticmethod
+    def _intern(conn: sqlite3.Connection, keywords: list) -> dict:
+        """키워드 목록을 ID로 변환 (없는 키워드는 새로 등록) {정규화 키워드: ID}"""
+        by_norm = {}
+        for keyword in keywords:
+            by_norm.setdefault(normalize_keyword(keyword), keyword)
+        conn.executemany("INSERT OR IGNORE INTO keywords (norm, keyword) VALUES (?, ?)", by_norm.items())
+        return dict(conn.execute(
+            "SELECT norm, id FROM keywords WHERE norm IN (SELECT value FROM json_each(?))",
+            (json.dumps(list(by_norm), ensure_ascii=False),)
+        ).fetchall())
+    
+    def _ids(self, conn: sqlite3.Connection, keywords: list) -> list:
+        """이미 등록된 키워드의 ID 목록 (없는 키워드는 제외)"""
+        norms = [normalize_keyword(keyword) for keyword in keywords]
+        return [row[0] for row in conn.execute(
+            "SELECT id FROM keywords WHERE norm IN (SELECT value FROM json_each(?))",
+            (json.dumps(norms, ensure_ascii=False),)
+        )]
+    
+    def add_edges(self, source: str, related: list, updated_at: float = None):
+        """시드 키워드 하나와 그 연관 키워드 목록의 관계 저장"""
+        self.add_edges_many([(source, keyword) for keyword in related], updated_at=updated_at)
+    
+    def add_edges_many(self, edges: list, updated_at: float = None):
+        """[(시드 키워드, 연관 키워드), ...] 관계를 한 트랜잭션으로 저장 (자기 자신으로의 관계는 제외)"""
+        if not edges:
+            return
+        updated_at = updated_at or time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("BEGIN")
+                ids = self._intern(conn, [keyword for edge in edges for keyword in edge])
+                rows = {
+                    (ids[normalize_keyword(src)], ids[normalize_keyword(dst)])
+                    for src, dst in edges
+                }
+                conn.executemany(
+                    "INSERT OR REPLACE INTO edges (src, dst, updated_at) VALUES (?, ?, ?)",
+                    [(src, dst, updated_at) for src, dst in rows if src != dst]
+                )
+    
+    def _step(self, conn: sqlite3.Connection, ids: list, reverse: bool = False) -> list:
+        """ID 집합의 한 단계 이웃 [(출발 ID, 도착 ID)] (reverse=True면 들어오는 방향)"""
+        if reverse:
+            query = "SELECT dst, src FROM edges WHERE dst IN (SELECT value FROM json_each(?))"
+        else:
+            query = "SELECT src, dst FROM edges WHERE src IN (SELECT value FROM json_each(?))"
+        return conn.execute(query, (json.dumps(ids),)).fetchall()
+    
+    def _names(self, conn: sqlite3.Connection, ids) -> dict:
+        """{ID: 키워드} 변환"""
+        return dict(conn.execute(
+            "SELECT id, keyword FROM keywords WHERE id IN (SELECT value FROM json_each(?))",
+            (json.dumps(list(ids)),)
+        ).fetchall())
+    
+    def _walk(self, keyword: str, max_hops: int, reverse: bool) -> dict:
+        """키워드에서 max_hops 단계까지 너비 우선 탐색 {키워드: 거리}"""
+        with self._lock:
+            conn = self._connect()
+            start = self._ids(conn, [keyword])
+            if not start:
+                return {}
+            distance = {start[0]: 0}
+            frontier = start
+            for hop in range(1, max_hops + 1):
+                next_frontier = []
+                for _, node in self._step(conn, frontier, reverse):
+                    if node not in distance:
+                        distance[node] = hop
+                        next_frontier.append(node)
+                if not next_frontier:
+                    break
+                frontier = next_frontier
+            del distance[start[0]]
+            names = self._names(conn, distance)
+        # 너비 우선 탐색 순서로 기록했으므로 이미 거리순
+        return {names[node]: hops for node, hops in distance.items()}
+    
+    def neighbors(self, keyword: str) -> list:
+        """키워드를 시드로 조회했을 때 나온 연관 키워드 목록"""
+        return list(self._walk(keyword, 1, reverse=False))
+    
+    def predecessors(self, keyword: str) -> list:
+        """조회 결과에 이 키워드가 포함되었던 시드 키워드 목록"""
+        return list(self._walk(keyword, 1, reverse=True))
+    
+    def two_hop(self, keyword: str) -> dict:
+        """2단계 이내 연관 키워드 {키워드: 거리(1 또는 2)}"""
+        return self._walk(keyword, 2, reverse=False)
+    
+    def ancestors(self, keyword: str, max_hops: int = 2) -> dict:
+        """max_hops 단계 이내에서 이 키워드로 이어지는 시드 키워드 {키워드: 거리}"""
+        return self._walk(keyword, max_hops, reverse=True)
+    
+    def overlap(self, first: str, second: str) -> dict:
+        """두 키워드의 공통 연관 키워드와 자카드 유사도"""
+        with self._lock:
+            conn = self._connect()
+            ids = self._ids(conn, [first])[:1] + self._ids(conn, [second])[:1]
+            if len(ids) < 2:
+                return {'common': [], 'jaccard': 0.0}
+            adjacency = {node: set() for node in ids}
+            for src, dst in self._step(conn, ids):
+                adjacency[src].add(dst)
+            common = adjacency[ids[0]] & adjacency[ids[1]]
+            union = adjacency[ids[0]] | adjacency[ids[1]]
+            names = self._names(conn, common)
+        return {
+            'common': sorted(names[node] for node in common),
+            'jaccard': len(common) / len(union) if union else 0.0
+        }
+    
+    def shortest_hops(self, source: str, target: str, max_hops: int = 4):
+        """source에서 target까지의 최단 경로 [source, ..., target] (max_hops 안에 없으면 None)
+
+        양쪽에서 동시에 너비 우선 탐색하며 매번 더 작은 쪽을 한 단계 넓힌다.
+        """
+        with self._lock:
+            conn = self._connect()
+            start, goal = self._ids(conn, [source]), self._ids(conn, [target])
+            if not start or not goal:
+                return None
+            start, goal = start[0], goal[0]
+            if start == goal:
+                return [self._names(conn, [start])[start]]
+            
+            forward, backward = {start: None}, {goal: None}  # 노드 → 경로상의 이전/다음 노드
+            forward_frontier, backward_frontier = [start], [goal]
+            meeting = None
+            for _ in range(max_hops):
+                expand_forward = len(forward_frontier) <= len(backward_frontier)
+                frontier = forward_frontier if expand_forward else backward_frontier
+                visited, other = (forward, backward) if expand_forward else (backward, forward)
+                next_frontier = []
+                for node, neighbor in self._step(conn, frontier, reverse=not expand_forward):
+                    if neighbor in visited:
+                        continue
+                    visited[neighbor] = node
+                    next_frontier.append(neighbor)
+                    if neighbor in other:
+                        meeting = neighbor
+                        break
+                if meeting is not None or not next_frontier:
+                    break
+                if expand_forward:
+                    forward_frontier = next_frontier
+                else:
+                    backward_frontier = next_frontier
+            if meeting is None:
+                return None
+            
+            path = []
+            node = meeting
+            while node is not None:
+                path.append(node)
+                node = forward[node]
+            path.reverse()
+            node = backward[meeting]
+            while node is not None:
+                path.append(node)
+                node = backward[node]
+            names = self._names(conn, path)
+        return [names[node] for node in path]
+    
+    def stats(self) -> dict:
+        """저장된 키워드 수와 관계 수"""
+        with self._lock:
+            conn = self._connect()
+            return {
+                'keywords': conn.execute("SELECT COUNT(*) FROM keywords").fetchone()[0],
+                'edges': conn.execute("SELECT COUNT(*) FROM edges").fetchone()[0]
+            }
+
+# 앱 전체가 공유하는 키워드 관계 그래프
+keyword_graph = KeywordGraphStore(os.path.join(StorageConfig.DATA_DIR, "keyword_graph.sqlite3"))
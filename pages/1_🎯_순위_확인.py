@@ -5,9 +5,14 @@
 
 import streamlit as st
 import pandas as pd
+import re
 import time
-from api import get_top_ranked_product_by_mall
-from config import AppConfig, AuthConfig
+from api import iter_mall_products, iter_malls_products
+from scheduler import run_keyword_tasks
+from history import rank_history
+from tracker import watchlist
+from jobs import job_queue
+from config import AppConfig, AuthConfig, JobConfig, StorageConfig, TrackerConfig
 from auth import initialize_session, is_logged_in, logout_user
 
 def render_navigation_sidebar():
@@ -179,12 +184,23 @@ def render_rank_checker_page():
         # 판매처명 입력
         mall_name = st.text_input(
             "🏪 판매처명",
-            placeholder="쿠팡",
+            placeholder="쿠팡, 11번가, G마켓",
+            help="쉼표로 여러 판매처를 입력하면 한 번의 검색으로 판매처별 순위를 비교합니다",
             key="rank_mall"
         )
         
         # 검색 옵션
         show_details = st.checkbox("📋 상세 정보 표시", value=True)
+        collect_all = st.checkbox(
+            "📚 모든 노출 상품 수집",
+            value=False,
+            help="최고 순위 상품뿐 아니라 해당 판매처의 모든 노출 상품을 찾습니다 (전체 페이지 조회)"
+        )
+        run_as_job = st.checkbox(
+            "🧾 백그라운드 작업으로 실행",
+            value=False,
+            help=f"최대 {JobConfig.MAX_JOB_KEYWORDS}개 키워드를 서버에서 처리합니다. 페이지를 이동하거나 새로고침해도 작업이 계속됩니다."
+        )
         
         # 검색 버튼
         search_button = st.button(
@@ -195,41 +211,75 @@ def render_rank_checker_page():
         )
     
     with col2:
-        st.info(f"**최대 {AppConfig.MAX_KEYWORDS}개 키워드**\n쉼표로 구분하여 입력")
+        st.info(f"**최대 {AppConfig.MAX_KEYWORDS}개 키워드**\n쉼표 또는 줄바꿈으로 구분하여 입력\n\n백그라운드 작업은 최대 {JobConfig.MAX_JOB_KEYWORDS}개")
     
     # 검색 실행
     if search_button:
-        if not keywords_input.strip() or not mall_name.strip():
+        # 키워드/판매처 파싱 - 판매처가 여러 개면 다중 판매처 비교 모드
+        keywords = list(dict.fromkeys(k.strip() for k in re.split(r"[,\n]", keywords_input) if k.strip()))
+        mall_names = list(dict.fromkeys(m.strip() for m in mall_name.split(",") if m.strip()))
+        
+        # 빈 입력뿐 아니라 구분자만 입력한 경우("," 등)도 파싱 결과가 비어 있음
+        if not keywords or not mall_names:
             st.error("❌ 검색어와 판매처명을 모두 입력해주세요.")
             return
         
-        # 키워드 파싱
-        keywords = [k.strip() for k in keywords_input.split(",") if k.strip()]
+        max_keywords = JobConfig.MAX_JOB_KEYWORDS if run_as_job else AppConfig.MAX_KEYWORDS
         
-        if len(keywords) > AppConfig.MAX_KEYWORDS:
-            st.error(f"❌ 검색어는 최대 {AppConfig.MAX_KEYWORDS}개까지만 입력 가능합니다.")
+        if len(keywords) > max_keywords:
+            st.error(f"❌ 검색어는 최대 {max_keywords}개까지만 입력 가능합니다.")
             return
         
+        if run_as_job:
+            # 작업 ID를 세션과 URL에 저장하여 재실행/새로고침 후에도 이어서 조회
+            job_id = job_queue.submit(
+                'rank', keywords, {'mall_names': mall_names}, owner=st.session_state.get('username')
+            )
+            st.session_state['rank_job_id'] = job_id
+            st.query_params['job'] = job_id
+            st.success(f"🧾 {len(keywords)}개 키워드 작업을 제출했습니다. 아래에서 진행 상황을 확인하세요.")
+            return
+        
+        if len(mall_names) > 1:
+            render_multi_mall_results(keywords, mall_names, collect_all)
+            return
+        mall_name = mall_names[0]
+        
         # 검색 시작
         st.success(f"🔄 {len(keywords)}개 키워드로 '{mall_name}' 판매처 검색을 시작합니다...")
         
         results = {}
+        failed_keywords = set()
         progress_bar = st.progress(0)
         status_text = st.empty()
         
         # 결과 표시 영역
         results_container = st.container()
         
-        for i, keyword in enumerate(keywords):
-            status_text.text(f"🔍 '{keyword}' 검색 중... ({i+1}/{len(keywords)})")
+        # 키워드별 스캔을 동시에 실행 (첫 번째 일치 상품에서 조기 종료, 또는 모든 노출 상품 수집)
+        # 모든 노출 상품 수집 모드는 항상 전체 페이지를 조회하므로 페이지도 병렬로 요청
+        def scan_keyword(keyword):
+            return [
+                record.to_dict()
+                for record in iter_mall_products(keyword, mall_name, collect_all=collect_all, parallel=collect_all)
+            ]
+        
+        status_text.text(f"🔍 {len(keywords)}개 키워드 동시 검색 중...")
+        
+        for i, (keyword, all_products, error) in enumerate(run_keyword_tasks(keywords, scan_keyword)):
+            status_text.text(f"🔍 '{keyword}' 검색 완료 ({i+1}/{len(keywords)})")
             progress_bar.progress((i + 1) / len(keywords))
             
-            result = get_top_ranked_product_by_mall(keyword, mall_name)
+            all_products = all_products or []
+            result = all_products[0] if all_products else None
             results[keyword] = result
             
-            # 실시간 결과 표시
+            # 완료되는 순서대로 결과 표시
             with results_container:
-                if result:
+                if error:
+                    failed_keywords.add(keyword)
+                    st.error(f"❌ **{keyword}** → API 요청 중 오류가 발생했습니다: {error}")
+                elif result:
                     st.success(f"✅ **{keyword}** → {result['rank']}위 발견!")
                     
                     if show_details:
@@ -248,16 +298,35 @@ def render_rank_checker_page():
                                 st.link_button("🛒 상품 페이지", result['link'], use_container_width=True)
                             with col_link2:
                                 st.write(f"**카테고리:** {result.get('category1', 'N/A')}")
+                    
+                    if len(all_products) > 1:
+                        with st.expander(f"📚 {keyword} 전체 노출 상품 ({len(all_products)}개)"):
+                            df_all = pd.DataFrame([{
+                                '순위': f"{product['rank']}위",
+                                '상품명': product['title'],
+                                '가격': f"{int(product['price']):,}원",
+                                '링크': product['link']
+                            } for product in all_products])
+                            st.dataframe(
+                                df_all,
+                                use_container_width=True,
+                                hide_index=True,
+                                column_config={
+                                    "링크": st.column_config.LinkColumn("상품 링크", display_text="🛒 상품보기")
+                                }
+                            )
                 else:
                     st.warning(f"❌ **{keyword}** → '{mall_name}' 판매처에서 검색 결과 없음")
-            
-            # API 호출 간격 조절
-            time.sleep(0.2)
         
         # 검색 완료
         status_text.text("✅ 모든 검색이 완료되었습니다!")
         progress_bar.progress(1.0)
         
+        # 오류 없이 확인된 결과는 순위 이력에 저장
+        rank_history.record_many([
+            (keyword, mall_name, result) for keyword, result in results.items() if keyword not in failed_keywords
+        ])
+        
         # 결과 요약 및 분석
         st.markdown("---")
         st.subheader("📊 검색 결과 분석")
@@ -403,6 +472,308 @@ def render_rank_checker_page():
             4. **다른 판매처**: 해당 판매처에서 실제로 판매하는지 확인
             """)
 
+def render_multi_mall_results(keywords: list, mall_names: list, collect_all: bool):
+    """다중 판매처 순위 비교 - 키워드당 한 번의 크롤링으로 모든 판매처 순위 확인"""
+    st.success(f"🔄 {len(keywords)}개 키워드로 {len(mall_names)}개 판매처 순위 비교를 시작합니다...")
+    
+    results = {}
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+    results_container = st.container()
+    
+    # 키워드당 한 번의 크롤링으로 모든 판매처를 확인하며, 키워드끼리는 동시에 실행
+    def scan_keyword(keyword):
+        mall_results = {name: [] for name in mall_names}
+        for name, record in iter_malls_products(keyword, mall_names, collect_all=collect_all, parallel=collect_all):
+            mall_results[name].append(record.to_dict())
+        return mall_results
+    
+    status_text.text(f"🔍 {len(keywords)}개 키워드 동시 검색 중...")
+    
+    for i, (keyword, mall_results, error) in enumerate(run_keyword_tasks(keywords, scan_keyword)):
+        status_text.text(f"🔍 '{keyword}' 검색 완료 ({i+1}/{len(keywords)})")
+        progress_bar.progress((i + 1) / len(keywords))
+        
+        mall_results = mall_results or {name: [] for name in mall_names}
+        # 판매처별 최고 순위는 리스트의 첫 번째 상품
+        best_results = {name: (products[0] if products else None) for name, products in mall_results.items()}
+        results[keyword] = best_results
+        
+        if error:
+            with results_container:
+                st.error(f"❌ **{keyword}** → API 요청 중 오류가 발생했습니다: {error}")
+            continue
+        
+        rank_history.record_many([(keyword, name, product) for name, product in best_results.items()])
+        
+        with results_container:
+            found = {name: product for name, product in best_results.items() if product}
+            if found:
+                summary = ", ".join(f"{name} {product['rank']}위" for name, product in sorted(found.items(), key=lambda x: x[1]['rank']))
+                st.success(f"✅ **{keyword}** → {summary}")
+            else:
+                st.warning(f"❌ **{keyword}** → 입력한 판매처에서 검색 결과 없음")
+            
+            if collect_all and any(mall_results.values()):
+                with st.expander(f"📚 {keyword} 판매처별 전체 노출 상품"):
+                    st.dataframe(
+                        pd.DataFrame([{
+                            '판매처': name,
+                            '순위': f"{product['rank']}위",
+                            '상품명': product['title'],
+                            '가격': f"{int(product['price']):,}원"
+                        } for name, products in mall_results.items() for product in products]),
+                        use_container_width=True,
+                        hide_index=True
+                    )
+    
+    status_text.text("✅ 모든 검색이 완료되었습니다!")
+    progress_bar.progress(1.0)
+    
+    # 키워드 × 판매처 순위 비교표
+    st.markdown("---")
+    st.subheader("📊 판매처별 순위 비교")
+    
+    df_compare = pd.DataFrame([
+        {'키워드': keyword, **{name: (product['rank'] if product else None) for name, product in mall_results.items()}}
+        for keyword, mall_results in results.items()
+    ]).set_index('키워드')
+    
+    st.dataframe(df_compare, use_container_width=True)
+    
+    csv_data = df_compare.to_csv(encoding='utf-8-sig')
+    st.download_button(
+        label=f"📥 순위 비교 CSV 다운로드 ({len(df_compare)}개)",
+        data=csv_data,
+        file_name=f"판매처비교_순위결과_{time.strftime('%Y%m%d_%H%M%S')}.csv",
+        mime="text/csv",
+        use_container_width=True
+    )
+
+def render_rank_jobs():
+    """백그라운드 순위 확인 작업 상태 및 부분 결과 조회"""
+    recent_jobs = [job for job in job_queue.recent_jobs(owner=st.session_state.get('username')) if job['kind'] == 'rank']
+    job_id = st.session_state.get('rank_job_id') or st.query_params.get('job')
+    if not recent_jobs and not job_id:
+        return
+    
+    st.markdown("---")
+    st.subheader("🧾 백그라운드 작업")
+    
+    job_ids = [job['id'] for job in recent_jobs]
+    if job_id and job_id not in job_ids:
+        job_ids.insert(0, job_id)
+    
+    def format_job(jid):
+        job = next((j for j in recent_jobs if j['id'] == jid), None) or job_queue.status(jid)
+        if job is None:
+            return jid
+        created = time.strftime('%m-%d %H:%M', time.localtime(job['created_at']))
+        return f"{created} · {', '.join(job['params']['mall_names'])} · {job['total']}개 키워드 ({job['state']})"
+    
+    selected = st.selectbox(
+        "작업 선택",
+        options=job_ids,
+        index=job_ids.index(job_id) if job_id in job_ids else 0,
+        format_func=format_job,
+        key="rank_job_select"
+    )
+    st.session_state['rank_job_id'] = selected
+    st.query_params['job'] = selected
+    
+    job = job_queue.status(selected)
+    if job is None:
+        st.warning("작업을 찾을 수 없습니다.")
+        return
+    
+    # 진행 중인 작업은 이 영역만 주기적으로 다시 그려서 페이지의 나머지(검색 결과, 관심 목록 등)는 유지
+    auto_refresh = job['state'] in ('pending', 'running') and st.checkbox(
+        "⏱️ 자동 새로고침", value=True, key="rank_job_autorefresh"
+    )
+    run_every = JobConfig.POLL_SECONDS * 2 if auto_refresh else None
+    st.fragment(render_rank_job_status, run_every=run_every)(selected)
+
+def render_rank_job_status(job_id: str):
+    """작업 진행 상황과 부분 결과 (자동 새로고침 시 이 부분만 재실행됨)"""
+    job = job_queue.status(job_id)
+    if job is None:
+        st.warning("작업을 찾을 수 없습니다.")
+        return
+    
+    finished = job['done'] + job['failed']
+    st.progress(finished / job['total'] if job['total'] else 1.0)
+    
+    col_metric1, col_metric2, col_metric3, col_action = st.columns(4)
+    with col_metric1:
+        st.metric("완료", f"{job['done']}/{job['total']}")
+    with col_metric2:
+        st.metric("실패", job['failed'])
+    with col_metric3:
+        st.metric("대기", job['pending'])
+    with col_action:
+        if job['state'] in ('pending', 'running'):
+            if st.button("⏹️ 작업 취소", use_container_width=True, key="rank_job_cancel"):
+                job_queue.cancel(job_id)
+                st.rerun(scope="fragment")
+        # 버튼을 누르면 이 영역이 다시 실행되어 최신 상태를 표시
+        st.button("🔄 새로고침", use_container_width=True, key="rank_job_refresh")
+    
+    # 진행 중에도 완료된 키워드의 부분 결과를 표시
+    mall_names = job['params']['mall_names']
+    rows = []
+    for keyword, result, error in job_queue.results(job_id):
+        row = {'키워드': keyword}
+        for name in mall_names:
+            product = (result or {}).get(name)
+            row[name] = product['rank'] if product else None
+        row['오류'] = error
+        rows.append(row)
+    
+    if rows:
+        df_job = pd.DataFrame(rows).set_index('키워드')
+        if not df_job['오류'].notna().any():
+            df_job = df_job.drop(columns=['오류'])
+        st.dataframe(df_job, use_container_width=True)
+        st.download_button(
+            label=f"📥 작업 결과 CSV 다운로드 ({len(df_job)}개)",
+            data=df_job.to_csv(encoding='utf-8-sig'),
+            file_name=f"순위작업_{job_id}_{time.strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+    
+    if job['state'] in ('pending', 'running'):
+        job_queue.start_workers()
+
+def render_watchlist():
+    """관심 키워드 자동 추적 - 백그라운드 추적기가 미리 계산한 순위를 바로 표시"""
+    st.markdown("---")
+    st.subheader("📌 관심 키워드 자동 추적")
+    st.caption("등록된 키워드는 백그라운드 추적기(`python tracker.py run`)가 주기적으로 재확인합니다.")
+    
+    with st.form("watchlist_form", clear_on_submit=True):
+        col_keyword, col_mall, col_interval = st.columns([2, 2, 1])
+        with col_keyword:
+            new_keyword = st.text_input("키워드", placeholder="무선 마우스")
+        with col_mall:
+            new_mall = st.text_input("판매처명", placeholder="쿠팡")
+        with col_interval:
+            new_interval = st.number_input(
+                "주기 (분)",
+                min_value=10,
+                max_value=1440,
+                value=TrackerConfig.DEFAULT_INTERVAL_MINUTES,
+                step=10
+            )
+        if st.form_submit_button("➕ 추적 추가", use_container_width=True):
+            if new_keyword.strip() and new_mall.strip():
+                watchlist.add(new_keyword.strip(), new_mall.strip(), int(new_interval))
+                st.success(f"✅ '{new_keyword.strip()}' / '{new_mall.strip()}' 추적을 시작합니다.")
+            else:
+                st.warning("⚠️ 키워드와 판매처명을 모두 입력해주세요.")
+    
+    items = watchlist.items()
+    if not items:
+        st.info("추적 중인 키워드가 없습니다.")
+        return
+    
+    for item in items:
+        last = rank_history.last_result(item['keyword'], item['mall_name'])
+        col_name, col_rank, col_checked, col_remove = st.columns([3, 1, 2, 1])
+        with col_name:
+            st.write(f"**{item['keyword']}** / {item['mall_name']} ({item['interval_minutes']}분 주기)")
+        with col_rank:
+            if last is None:
+                st.write("확인 대기")
+            elif not last['rank']:
+                st.write("순위권 밖")
+            elif last['proven']:
+                st.write(f"{last['rank']}위")
+            else:
+                # 추적 중인 상품의 순위 - 판매처 최고 순위는 다음 전체 스캔에서 확정됨
+                st.write(f"{last['rank']}위")
+                st.caption("미확정 (증분 확인)")
+        with col_checked:
+            if item['last_checked_at']:
+                st.caption(f"마지막 확인: {time.strftime('%Y-%m-%d %H:%M', time.localtime(item['last_checked_at']))}")
+        with col_remove:
+            if st.button("🗑️ 제거", key=f"watch_remove_{item['keyword']}_{item['mall_name']}", use_container_width=True):
+                watchlist.remove(item['keyword'], item['mall_name'])
+                st.rerun()
+
+def render_rank_history():
+    """저장된 순위 이력 차트 - API 호출 없이 저장소에서 바로 조회"""
+    tracked_pairs = rank_history.tracked_pairs()
+    if not tracked_pairs:
+        return
+    
+    st.markdown("---")
+    st.subheader("🕘 순위 변화 추이")
+    
+    col_select, col_days = st.columns([3, 1])
+    with col_select:
+        selected = st.selectbox(
+            "키워드 / 판매처",
+            options=tracked_pairs,
+            format_func=lambda pair: f"{pair[0]} / {pair[1]}",
+            key="history_pair"
+        )
+    with col_days:
+        days = st.number_input(
+            "조회 기간 (일)",
+            min_value=1,
+            max_value=365,
+            value=StorageConfig.HISTORY_DEFAULT_DAYS,
+            key="history_days"
+        )
+    
+    df_history = rank_history.query(selected[0], selected[1], days=int(days))
+    if df_history.empty:
+        st.info("선택한 기간에 저장된 이력이 없습니다.")
+        return
+    
+    import altair as alt
+    
+    df_found = df_history.dropna(subset=['rank'])
+    if df_found.empty:
+        st.warning(f"최근 {int(days)}일 동안 '{selected[1]}' 판매처가 순위권에 없었습니다.")
+    else:
+        # 증분 재확인으로 얻은 미확정 순위는 점 모양/색으로 구분
+        df_chart = df_found.assign(status=df_found['proven'].map({True: '확정', False: '미확정 (증분)'}))
+        base = alt.Chart(df_chart).encode(
+            x=alt.X('checked_at:T', title='확인 시각'),
+            y=alt.Y('rank:Q', title='순위 (낮을수록 좋음)', scale=alt.Scale(reverse=True))
+        )
+        points = base.mark_point(filled=True, size=60).encode(
+            color=alt.Color('status:N', title='순위 구분',
+                            scale=alt.Scale(domain=['확정', '미확정 (증분)'], range=['#20B2AA', '#FFA500'])),
+            shape=alt.Shape('status:N', title='순위 구분'),
+            tooltip=[
+                alt.Tooltip('checked_at:T', title='확인 시각', format='%Y-%m-%d %H:%M'),
+                alt.Tooltip('rank:Q', title='순위'),
+                alt.Tooltip('status:N', title='구분'),
+                alt.Tooltip('price:Q', title='가격', format=',.0f'),
+                alt.Tooltip('title:N', title='상품명')
+            ]
+        )
+        chart = (base.mark_line(color='#20B2AA') + points).properties(height=300)
+        st.altair_chart(chart, use_container_width=True)
+        if not df_found['proven'].all():
+            st.caption("🟠 미확정 순위는 추적 중인 상품의 순위로, 판매처 최고 순위보다 낮을 수 있습니다.")
+    
+    col_metric1, col_metric2, col_metric3 = st.columns(3)
+    with col_metric1:
+        st.metric("확인 횟수", len(df_history))
+    with col_metric2:
+        df_proven = df_found[df_found['proven']]
+        st.metric("최고 순위 (확정)", f"{int(df_proven['rank'].min())}위" if not df_proven.empty else "-")
+    with col_metric3:
+        latest = df_history.iloc[-1]
+        if pd.isna(latest['rank']):
+            st.metric("최근 순위", "순위권 밖")
+        else:
+            st.metric("최근 순위", f"{int(latest['rank'])}위" + ("" if latest['proven'] else " (미확정)"))
+
 def main():
     """순위 확인 페이지 메인"""
     # 페이지 설정
@@ -419,6 +790,9 @@ def main():
     # 인증 확인
     if is_logged_in():
         render_rank_checker_page()
+        render_rank_jobs()
+        render_watchlist()
+        render_rank_history()
         
         # 푸터
         st.markdown("---")
@@ -8,7 +8,9 @@ import pandas as pd
 import altair as alt
 import time
 from api import get_related_keywords
-from config import AppConfig, AuthConfig
+from config import AppConfig, AuthConfig, ExpansionConfig
+from expansion import expand_keywords
+from keyword_graph import keyword_graph
 from auth import initialize_session, is_logged_in, logout_user
 
 def safe_float_conversion(value):
@@ -153,6 +155,13 @@ def render_related_keywords_page():
             ["검색량", "경쟁도", "키워드명"],
             help="결과 정렬 기준 선택"
         )
+        
+        # 캐시 무시
+        refresh_stats = st.checkbox(
+            "🔄 새로 조회",
+            value=False,
+            help="월간 통계는 다음 갱신일까지 저장된 결과를 사용합니다. 체크하면 API에서 다시 가져옵니다."
+        )
     
     # 검색 버튼
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -162,7 +171,7 @@ def render_related_keywords_page():
     if search_clicked and keyword_input:
         with st.spinner("🔍 연관 키워드를 검색하고 있습니다..."):
             # 연관 키워드 검색
-            keywords_data = get_related_keywords(keyword_input.strip())
+            keywords_data = get_related_keywords(keyword_input.strip(), refresh=refresh_stats)
             
             if keywords_data and len(keywords_data) > 0:
                 # 결과를 DataFrame으로 변환
@@ -472,6 +481,111 @@ def render_related_keywords_page():
         
         st.markdown('</div>', unsafe_allow_html=True)
 
+def render_keyword_expansion():
+    """연관 키워드 확장 탐색 - 발견한 키워드를 다시 시드로 넣어 롱테일 키워드 발굴"""
+    st.markdown("---")
+    st.markdown("## 🌱 연관 키워드 확장 탐색")
+    st.caption("발견한 연관 키워드를 다시 검색해 여러 단계로 확장합니다. 캐시에 있는 키워드는 호출 예산을 쓰지 않으며, 예산 안에서 검색량이 많은 키워드부터 조회합니다.")
+    
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        seed = st.text_input("🌱 시드 키워드", placeholder="예: 캠핑의자", key="expansion_seed")
+    with col2:
+        depth = st.number_input("탐색 깊이", min_value=1, max_value=ExpansionConfig.MAX_DEPTH,
+                                value=ExpansionConfig.DEFAULT_DEPTH, key="expansion_depth")
+    with col3:
+        budget = st.number_input("최대 API 호출 수", min_value=1, max_value=ExpansionConfig.MAX_CALL_BUDGET,
+                                 value=ExpansionConfig.DEFAULT_CALL_BUDGET, key="expansion_budget")
+    
+    if st.button("🌱 확장 탐색 시작", key="expansion_start") and seed.strip():
+        status = st.empty()
+        
+        def show_progress(level, calls, found):
+            status.info(f"🔄 {level}단계 완료 - 호출 {calls}회, 발견 키워드 {found}개")
+        
+        with st.spinner("🔍 연관 키워드를 확장하고 있습니다..."):
+            result = expand_keywords(seed, max_depth=int(depth), max_calls=int(budget), on_progress=show_progress)
+        status.empty()
+        st.session_state.expansion_result = result
+        st.session_state.expansion_seed_keyword = seed.strip()
+        if result['errors']:
+            st.warning(f"⚠️ {len(result['errors'])}개 키워드는 확장하지 못했습니다.")
+    
+    result = st.session_state.get('expansion_result')
+    if not result or not result['keywords']:
+        return
+    
+    df = pd.DataFrame(result['keywords'])
+    st.success(
+        f"✅ '{st.session_state.expansion_seed_keyword}'에서 키워드 {len(df)}개를 발견했습니다 "
+        f"(API 호출 {result['calls']}회, 캐시 사용 {result['cache_hits']}회)"
+    )
+    
+    depth_counts = df.groupby('depth').size()
+    cols = st.columns(len(depth_counts))
+    for col, (level, count) in zip(cols, depth_counts.items()):
+        col.metric(f"{level}단계" if level else "시드", f"{count}개")
+    
+    columns = {
+        'keyword': '키워드', 'depth': '단계', 'parent': '발견 경로',
+        'total_monthly_search': '월간 검색수', 'total_monthly_avg_click': '월평균 클릭수',
+        'competition_level': '경쟁도'
+    }
+    view = df[[name for name in columns if name in df.columns]].rename(columns=columns)
+    st.dataframe(view, use_container_width=True, hide_index=True)
+    
+    # CSV 다운로드
+    csv_data = view.to_csv(index=False, encoding='utf-8-sig')
+    st.download_button(
+        label=f"📥 확장 결과 CSV 다운로드 ({len(view)}개)",
+        data=csv_data,
+        file_name=f"{st.session_state.expansion_seed_keyword}_확장키워드_{time.strftime('%Y%m%d_%H%M%S')}.csv",
+        mime="text/csv",
+        use_container_width=True,
+        key="expansion_download"
+    )
+
+def render_keyword_graph():
+    """저장된 키워드 관계 조회 - API를 다시 호출하지 않고 시드/연관 관계와 경로 확인"""
+    st.markdown("---")
+    st.markdown("## 🕸️ 키워드 관계 조회")
+    stats = keyword_graph.stats()
+    st.caption(f"지금까지 조회한 결과로 만든 관계 그래프입니다. (키워드 {stats['keywords']:,}개, 관계 {stats['edges']:,}개)")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        keyword = st.text_input("🔍 키워드", placeholder="예: 캠핑의자", key="graph_keyword")
+    with col2:
+        target = st.text_input("🎯 경로를 찾을 키워드 (선택)", placeholder="예: 접이식캠핑의자", key="graph_target")
+    
+    if not keyword.strip():
+        return
+    
+    ancestors = keyword_graph.ancestors(keyword)
+    two_hop = keyword_graph.two_hop(keyword)
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown(f"**⬅️ 이 키워드로 이어지는 시드** ({len(ancestors)}개)")
+        if ancestors:
+            st.dataframe(pd.DataFrame(list(ancestors.items()), columns=['키워드', '단계']),
+                         use_container_width=True, hide_index=True, height=300)
+    with col2:
+        st.markdown(f"**➡️ 2단계 이내 연관 키워드** ({len(two_hop)}개)")
+        if two_hop:
+            st.dataframe(pd.DataFrame(list(two_hop.items()), columns=['키워드', '단계']),
+                         use_container_width=True, hide_index=True, height=300)
+    if not ancestors and not two_hop:
+        st.info("ℹ️ 저장된 관계가 없습니다. 연관 키워드 분석이나 확장 탐색을 먼저 실행하세요.")
+    
+    if target.strip():
+        path = keyword_graph.shortest_hops(keyword, target)
+        overlap = keyword_graph.overlap(keyword, target)
+        if path:
+            st.success(f"🛤️ 최단 경로 ({len(path) - 1}단계): " + " → ".join(path))
+        else:
+            st.warning("⚠️ 저장된 관계 안에서 두 키워드를 잇는 경로를 찾지 못했습니다.")
+        st.write(f"공통 연관 키워드 {len(overlap['common'])}개 (유사도 {overlap['jaccard']:.1%})")
+
 def main():
     """연관 키워드 페이지 메인"""
     # 페이지 설정
@@ -488,6 +602,8 @@ def main():
     # 인증 확인
     if is_logged_in():
         render_related_keywords_page()
+        render_keyword_expansion()
+        render_keyword_graph()
         
         # 푸터
         st.markdown("---")
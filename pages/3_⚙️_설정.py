@@ -5,6 +5,8 @@
 
 import streamlit as st
 import os
+from ratelimit import get_quota_status
+from runtime_config import runtime_config
 from config import AppConfig, APIConfig, AuthConfig
 from auth import initialize_session, is_logged_in, logout_user
 
@@ -317,6 +319,8 @@ def render_system_settings():
     # 고급 설정
     st.markdown("### ⚡ 고급 설정")
     
+    # 모든 세션/프로세스가 공유하는 실행 중 설정 (적용 즉시 반영)
+    current = runtime_config.all()
     col1, col2 = st.columns(2)
     
     with col1:
@@ -330,30 +334,68 @@ def render_system_settings():
             "API 타임아웃 (초)",
             min_value=5,
             max_value=60,
-            value=30,
-            help="API 호출 타임아웃 설정"
+            value=int(current['api_timeout']),
+            help="API 응답 대기 시간 (연결 타임아웃은 이 값을 넘지 않음)"
         )
     
     with col2:
         cache_enabled = st.checkbox(
             "캐시 사용",
-            value=True,
-            help="검색 결과 캐시 사용 여부"
+            value=current['cache_enabled'],
+            help="검색 결과/키워드 통계 캐시 사용 여부"
         )
         
         rate_limit = st.number_input(
             "API 호출 간격 (초)",
             min_value=0.1,
             max_value=5.0,
-            value=0.2,
+            value=float(current['api_call_interval']),
             step=0.1,
-            help="API 호출 간 대기 시간"
+            help="API 호출 간 최소 대기 시간 (API별 허용 속도보다 빠르게 호출하지는 않음)"
         )
     
+    col_apply, col_reset = st.columns(2)
+    
+    with col_apply:
+        if st.button("⚡ 실행 설정 적용", type="primary", use_container_width=True):
+            runtime_config.update({
+                'api_timeout': api_timeout,
+                'api_call_interval': rate_limit,
+                'cache_enabled': cache_enabled
+            })
+            st.success("✅ 실행 설정이 적용되었습니다. (재시작 없이 모든 세션에 바로 반영)")
+    
+    with col_reset:
+        if st.button("↩️ 기본값으로 되돌리기", use_container_width=True):
+            runtime_config.reset()
+            st.rerun()
+    
     # 시스템 정보
     st.markdown("---")
     st.markdown("### 💻 시스템 상태")
     
+    # 오늘의 API 호출 한도 사용 현황
+    quota_status = get_quota_status()
+    col_quota1, col_quota2 = st.columns(2)
+    
+    with col_quota1:
+        shopping_quota = quota_status['shopping']
+        st.metric(
+            "🛒 쇼핑 API 잔여 호출",
+            f"{shopping_quota['remaining']:,}회",
+            help=f"오늘 {shopping_quota['used']:,}회 사용 / 일일 한도 {shopping_quota['limit']:,}회"
+        )
+        st.progress(min(1.0, shopping_quota['used'] / shopping_quota['limit']) if shopping_quota['limit'] else 1.0)
+    
+    with col_quota2:
+        ads_quota = quota_status['ads']
+        st.metric(
+            "📢 검색광고 API 잔여 호출",
+            f"{ads_quota['remaining']:,}회",
+            help=f"오늘 {ads_quota['used']:,}회 사용 / 일일 한도 {ads_quota['limit']:,}회"
+        )
+        st.progress(min(1.0, ads_quota['used'] / ads_quota['limit']) if ads_quota['limit'] else 1.0)
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
@@ -260,6 +260,12 @@ def render_keyword_detail_analysis_page():
                 index=0,
                 help="결과를 어떤 기준으로 정렬할지 선택"
             )
+            
+            refresh_stats = st.checkbox(
+                "🔄 새로 조회",
+                value=False,
+                help="월간 통계는 다음 갱신일까지 저장된 결과를 사용합니다. 체크하면 API에서 다시 가져옵니다."
+            )
         
         # 검색 버튼
         analyze_button = st.button(
@@ -352,7 +358,7 @@ def render_keyword_detail_analysis_page():
         progress_bar.progress(0.3)
         
         # 상세 키워드 분석
-        detailed_stats = get_detailed_keyword_stats(target_keyword)
+        detailed_stats = get_detailed_keyword_stats(target_keyword, refresh=refresh_stats)
         
         progress_bar.progress(0.7)
         status_text.text("📊 데이터 처리 및 분석 중...")
@@ -0,0 +1,143 @@
+"""
+Rate limiter module for the marketing tool
+프로세스 전역 API 호출 속도 제한 (토큰 버킷) 및 일일 호출 한도 관리
+"""
+
+import os
+import threading
+import time
+from datetime import datetime
+from config import KST, RateLimitConfig, StorageConfig
+from runtime_config import runtime_config
+from sqlite_store import SQLiteStore
+
+class QuotaExceededError(Exception):
+    """일일 API 호출 한도 초과"""
+
+class DailyQuota(SQLiteStore):
+    """엔드포인트별 일일 호출 수를 SQLite에 저장하여 프로세스 간에 공유하는 한도 카운터"""
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS quota_usage (
+            name TEXT NOT NULL,
+            day TEXT NOT NULL,
+            used INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (name, day)
+        );
+    """
+    
+    def __init__(self, path: str, name: str, limit: int):
+        super().__init__(path)
+        self.name = name
+        self.limit = limit
+    
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(KST).strftime("%Y-%m-%d")
+    
+    def consume(self, count: int = 1):
+        """호출 count회를 차감 (한도를 넘으면 QuotaExceededError)"""
+        day = self._today()
+        with self._lock:
+            conn = self._connect()
+            conn.execute("INSERT OR IGNORE INTO quota_usage (name, day, used) VALUES (?, ?, 0)", (self.name, day))
+            # 한도 확인과 차감을 하나의 문장으로 처리하여 여러 프로세스가 동시에 호출해도 초과하지 않음
+            cursor = conn.execute(
+                "UPDATE quota_usage SET used = used + ? WHERE name = ? AND day = ? AND used + ? <= ?",
+                (count, self.name, day, count, self.limit)
+            )
+            if cursor.rowcount == 0:
+                raise QuotaExceededError(f"오늘의 {self.name} API 호출 한도({self.limit:,}회)를 모두 사용했습니다.")
+    
+    def used(self) -> int:
+        """오늘 사용한 호출 수"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT used FROM quota_usage WHERE name = ? AND day = ?", (self.name, self._today())
+            ).fetchone()
+        return row[0] if row else 0
+    
+    def remaining(self) -> int:
+        """오늘 남은 호출 수"""
+        return max(0, self.limit - self.used())
+
+class RateLimiter:
+    """스레드 안전 토큰 버킷 속도 제한기
+
+    초당 rate 개의 토큰이 최대 burst 개까지 채워지며,
+    토큰이 없으면 호출자를 다음 토큰이 생길 때까지 대기시킨다.
+    quota가 지정되면 호출마다 일일 한도를 차감한다.
+    rate_cap이 지정되면 호출 시점의 rate_cap() 값을 넘지 않도록 속도를 더 낮춘다.
+    """
+    
+    def __init__(self, rate: float, burst: int = 1, quota: DailyQuota = None, rate_cap=None):
+        self.base_rate = float(rate)
+        self.rate_cap = rate_cap
+        self.burst = max(1, int(burst))
+        self.quota = quota
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    @property
+    def rate(self) -> float:
+        """현재 초당 허용 호출 수"""
+        if self.rate_cap is None:
+            return self.base_rate
+        return min(self.base_rate, self.rate_cap())
+    
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고 사용 가능해질 때까지 기다려야 할 시간(초)을 반환"""
+        rate = self.rate
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / rate
+    
+    def acquire(self):
+        """일일 한도를 차감하고 토큰을 얻을 때까지 대기"""
+        if self.quota is not None:
+            self.quota.consume()
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+# 한도 사용량은 지워도 되는 캐시가 아니므로 영구 데이터 디렉터리에 저장
+_QUOTA_DB_PATH = os.path.join(StorageConfig.DATA_DIR, "api_quota.sqlite3")
+
+def _runtime_rate_cap() -> float:
+    """설정 페이지의 최소 호출 간격을 초당 호출 수로 환산"""
+    return 1 / runtime_config.get('api_call_interval')
+
+# 네이버 쇼핑 검색 API 전역 제한기 (모든 세션/스레드가 공유)
+shopping_limiter = RateLimiter(
+    RateLimitConfig.SHOPPING_CALLS_PER_SECOND,
+    RateLimitConfig.SHOPPING_BURST,
+    quota=DailyQuota(_QUOTA_DB_PATH, "shopping", RateLimitConfig.SHOPPING_DAILY_QUOTA),
+    rate_cap=_runtime_rate_cap
+)
+
+# 네이버 검색광고 API 전역 제한기
+ads_limiter = RateLimiter(
+    RateLimitConfig.ADS_CALLS_PER_SECOND,
+    RateLimitConfig.ADS_BURST,
+    quota=DailyQuota(_QUOTA_DB_PATH, "ads", RateLimitConfig.ADS_DAILY_QUOTA),
+    rate_cap=_runtime_rate_cap
+)
+
+def get_quota_status() -> dict:
+    """엔드포인트별 오늘의 한도/사용량/잔여량"""
+    status = {}
+    for limiter in (shopping_limiter, ads_limiter):
+        quota = limiter.quota
+        used = quota.used()
+        status[quota.name] = {
+            'limit': quota.limit,
+            'used': used,
+            'remaining': max(0, quota.limit - used)
+        }
+    return status
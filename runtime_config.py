@@ -0,0 +1,113 @@
+"""
+Runtime config module for the marketing tool
+설정 페이지에서 바꾸는 실행 중 설정(타임아웃, 호출 간격, 캐시 사용)을 저장하고
+모든 세션/프로세스가 재시작 없이 같은 값을 읽도록 공유
+"""
+
+import json
+import os
+import sqlite3
+import time
+from config import CacheConfig, NetworkConfig, RateLimitConfig, StorageConfig
+from sqlite_store import SQLiteStore
+
+# 설정 키 → (타입, 기본값, 최솟값, 최댓값)
+RUNTIME_SETTINGS = {
+    'api_timeout': (float, NetworkConfig.READ_TIMEOUT, 5.0, 60.0),  # 응답 읽기 타임아웃 (초)
+    'api_call_interval': (float, 1 / RateLimitConfig.SHOPPING_CALLS_PER_SECOND, 0.1, 5.0),  # 최소 호출 간격 (초)
+    'cache_enabled': (bool, CacheConfig.CACHE_ENABLED, None, None),
+}
+
+class RuntimeConfigStore(SQLiteStore):
+    """SQLite에 저장되는 실행 중 설정
+
+    요청마다 읽히므로 값은 메모리에 두고, 다른 연결(다른 프로세스의 추적기/CLI 등)이
+    값을 바꾸면 PRAGMA data_version 변화를 최대 check_interval초마다 확인해 다시 읽는다.
+    저장되지 않은 설정은 RUNTIME_SETTINGS의 기본값(config.py 값)을 사용한다.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runtime_settings (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        );
+    """
+    
+    def __init__(self, path: str, check_interval: float = 1.0):
+        super().__init__(path)
+        self.check_interval = check_interval
+        self._values = {}
+        self._data_version = None
+        self._checked_at = 0.0
+    
+    def _reload(self, conn: sqlite3.Connection):
+        """저장된 값을 다시 읽음 (잘못된 값이나 없어진 키는 무시)"""
+        values = {}
+        for key, value in conn.execute("SELECT key, value FROM runtime_settings"):
+            if key in RUNTIME_SETTINGS:
+                try:
+                    values[key] = self._coerce(key, json.loads(value))
+                except (ValueError, TypeError):
+                    continue
+        self._values = values
+    
+    def _refresh(self):
+        """다른 연결이 설정을 바꿨으면 다시 읽음 (check_interval마다 한 번만 확인)"""
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return
+        with self._lock:
+            conn = self._connect()
+            data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version != self._data_version:
+                self._reload(conn)
+                self._data_version = data_version
+            self._checked_at = now
+    
+    @staticmethod
+    def _coerce(key: str, value):
+        """설정 값을 타입 변환하고 허용 범위로 제한"""
+        kind, _, minimum, maximum = RUNTIME_SETTINGS[key]
+        value = kind(value)
+        if minimum is not None:
+            value = max(minimum, value)
+        if maximum is not None:
+            value = min(maximum, value)
+        return value
+    
+    def get(self, key: str):
+        """현재 설정 값 (저장된 값이 없으면 기본값)"""
+        self._refresh()
+        value = self._values.get(key)
+        return RUNTIME_SETTINGS[key][1] if value is None else value
+    
+    def all(self) -> dict:
+        """모든 설정의 현재 값"""
+        return {key: self.get(key) for key in RUNTIME_SETTINGS}
+    
+    def update(self, values: dict):
+        """여러 설정을 한 트랜잭션으로 저장하고 바로 적용"""
+        unknown = set(values) - set(RUNTIME_SETTINGS)
+        if unknown:
+            raise KeyError(f"알 수 없는 설정: {', '.join(sorted(unknown))}")
+        coerced = {key: self._coerce(key, value) for key, value in values.items()}
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("BEGIN")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO runtime_settings (key, value, updated_at) VALUES (?, ?, ?)",
+                    [(key, json.dumps(value), now) for key, value in coerced.items()]
+                )
+            self._values.update(coerced)
+    
+    def reset(self):
+        """저장된 설정을 모두 지우고 기본값으로 되돌림"""
+        with self._lock:
+            self._connect().execute("DELETE FROM runtime_settings")
+            self._values = {}
+
+# 앱 전체가 공유하는 실행 중 설정
+runtime_config = RuntimeConfigStore(os.path.join(StorageConfig.DATA_DIR, "runtime_config.sqlite3"))
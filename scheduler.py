@@ -0,0 +1,27 @@
+"""
+Scheduler module for the marketing tool
+여러 키워드 작업을 동시에 실행하고 끝나는 순서대로 결과 전달
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from config import RateLimitConfig
+
+def run_keyword_tasks(keywords: list, task, max_workers: int = None):
+    """키워드별 task(keyword)를 동시에 실행하고 완료되는 순서대로 (키워드, 결과, 오류) 반환
+
+    실제 API 호출 속도는 요청 경로의 공유 속도 제한기가 결정하므로,
+    전체 소요 시간은 지연 시간의 합이 아니라 API 호출 한도에 맞춰진다.
+    """
+    workers = max(1, min(max_workers or RateLimitConfig.MAX_KEYWORD_WORKERS, len(keywords) or 1))
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = {executor.submit(task, keyword): keyword for keyword in keywords}
+        for future in as_completed(futures):
+            keyword = futures[future]
+            try:
+                yield keyword, future.result(), None
+            except Exception as e:
+                yield keyword, None, e
+    finally:
+        # 화면 갱신 등으로 중단되면 대기 중인 작업은 취소
+        executor.shutdown(wait=False, cancel_futures=True)
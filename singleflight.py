@@ -0,0 +1,72 @@
+"""
+Singleflight module for the marketing tool
+동일한 요청이 동시에 여러 번 들어오면 업스트림 호출 한 번의 결과를 함께 사용
+"""
+
+import threading
+from config import NetworkConfig
+
+class _Call:
+    """진행 중인 호출 하나 (먼저 들어온 호출자가 실행, 나머지는 완료를 기다림)"""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+class SingleFlight:
+    """스레드 간 요청 병합 - 같은 키의 호출이 진행 중이면 그 결과를 공유
+
+    결과는 호출이 끝나는 즉시 잊으므로 캐시가 아니다. 완료 후 들어온
+    같은 키의 호출은 새로 실행된다 (재사용은 디스크 캐시가 담당).
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key, fn):
+        """key에 대한 fn()을 실행하거나 진행 중인 동일 호출의 결과(또는 오류)를 반환"""
+        if not NetworkConfig.COALESCE_REQUESTS:
+            return fn()
+
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> dict:
+        """실행된 호출 수와 다른 호출의 결과를 공유한 횟수"""
+        with self._lock:
+            return {'executed': self.executed, 'shared': self.shared, 'in_flight': len(self._calls)}
+
+# 모든 요청 경로가 공유하는 기본 인스턴스
+inflight = SingleFlight()
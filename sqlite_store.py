@@ -0,0 +1,47 @@
+"""
+SQLite store module for the marketing tool
+캐시, 호출 한도, 순위 이력, 관심 목록, 작업 큐, 키워드 그래프, 실행 중 설정 저장소가 공유하는 SQLite 연결 설정
+"""
+
+import os
+import sqlite3
+import threading
+
+# 다른 프로세스가 쓰기 잠금을 잡고 있을 때 기다릴 최대 시간 (초)
+BUSY_TIMEOUT = 30
+
+def open_sqlite(path: str, schema: str, synchronous: str = None) -> sqlite3.Connection:
+    """WAL 모드의 자동 커밋 연결을 열고 스키마 생성
+
+    스레드 간에 공유하는 연결이므로 호출자가 잠금으로 보호해야 하며,
+    여러 문장을 묶을 때는 호출자가 BEGIN으로 트랜잭션을 직접 연다.
+    synchronous를 지정하면 (예: "NORMAL") 해당 동기화 수준을 사용한다.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    if synchronous:
+        conn.execute(f"PRAGMA synchronous={synchronous}")
+    conn.executescript(schema)
+    return conn
+
+class SQLiteStore:
+    """최초 사용 시 연결하는 SQLite 저장소의 기반 클래스
+
+    하위 클래스는 SCHEMA(CREATE ... IF NOT EXISTS 스크립트)를 정의하고,
+    연결을 사용할 때는 self._lock을 잡은 채로 self._connect()를 호출한다.
+    """
+    
+    SCHEMA = ""
+    SYNCHRONOUS = None  # 지정하지 않으면 SQLite 기본값 (FULL)
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = None
+    
+    def _connect(self) -> sqlite3.Connection:
+        """최초 사용 시 데이터베이스 연결 및 테이블 생성"""
+        if self._conn is None:
+            self._conn = open_sqlite(self.path, self.SCHEMA, self.SYNCHRONOUS)
+        return self._conn
@@ -0,0 +1,14 @@
+"""
+테스트 공통 설정
+저장소 루트를 import 경로에 추가하고, 캐시/데이터 디렉터리를 임시 디렉터리로 분리
+"""
+
+import os
+import sys
+import tempfile
+
+# 앱 모듈이 import 시점에 설정을 읽으므로 가장 먼저 지정
+os.environ.setdefault("CACHE_DIR", tempfile.mkdtemp(prefix="marketing-tool-cache-"))
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="marketing-tool-data-"))
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,54 @@
+"""
+연관 키워드 확장 탐색(expand_keywords) 호출 예산 테스트
+가짜 검색광고 클라이언트로 캐시 적중과 실제 API 호출을 구분해 세는지 확인
+"""
+
+import expansion
+
+def record(keyword, total):
+    return {'keyword': keyword, 'total_monthly_search': total}
+
+# 시드 → 연관 키워드 (검색량이 많은 순으로 다음 단계 확장)
+RELATED = {
+    "시드": [record("시드", 100), record("A", 30), record("B", 20), record("C", 10)],
+    "A": [record("A", 30), record("A1", 5)],
+    "B": [record("B", 20), record("B1", 4)],
+    "C": [record("C", 10), record("C1", 3)],
+}
+
+class FakeAdsClient:
+    """cached에 있는 키워드는 캐시 적중, 나머지는 API 호출로 기록하는 가짜 클라이언트"""
+    
+    def __init__(self, cached=()):
+        self.cached = set(cached)
+        self.fetched = []
+    
+    def cached_keyword_stats(self, hint):
+        return RELATED.get(hint, []) if hint in self.cached else None
+    
+    def keyword_stats(self, hint, refresh=False):
+        self.fetched.append(hint)
+        return RELATED.get(hint, [])
+
+def expand(monkeypatch, cached=(), **kwargs):
+    fake = FakeAdsClient(cached)
+    monkeypatch.setattr(expansion, "ads_client", fake)
+    return fake, expansion.expand_keywords("시드", max_workers=1, **kwargs)
+
+def test_cache_hits_do_not_use_call_budget(monkeypatch):
+    fake, result = expand(monkeypatch, cached={"시드", "A", "B"}, max_depth=2, max_calls=1)
+    assert fake.fetched == ["C"]
+    assert (result['calls'], result['cache_hits']) == (1, 3)
+    assert {r['keyword'] for r in result['keywords']} >= {"A1", "B1", "C1"}
+
+def test_budget_limits_uncached_keywords_by_search_volume(monkeypatch):
+    fake, result = expand(monkeypatch, max_depth=2, max_calls=3)
+    # 시드 1회 + 남은 예산 2회는 검색량이 많은 A, B에 사용
+    assert fake.fetched == ["시드", "A", "B"]
+    assert (result['calls'], result['cache_hits']) == (3, 0)
+    assert "C1" not in {r['keyword'] for r in result['keywords']}
+
+def test_refresh_ignores_cache(monkeypatch):
+    fake, result = expand(monkeypatch, cached={"시드"}, max_depth=1, max_calls=5, refresh=True)
+    assert fake.fetched == ["시드"]
+    assert (result['calls'], result['cache_hits']) == (1, 0)
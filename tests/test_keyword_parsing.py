@@ -0,0 +1,62 @@
+"""
+keywordList 파서 테스트
+컬럼 단위 파서가 벤치마크의 항목별 파서(parse_items_legacy)와 같은 결과를 내는지,
+의도적으로 달라진 경우는 어떤 값인지 확인
+"""
+
+import pytest
+from ads_client import parse_detailed_keyword_list, parse_keyword_list_frame
+from benchmarks.bench_keyword_parsing import make_keyword_list, parse_items_legacy
+
+STAT_FIELDS = ['monthlyPcQcCnt', 'monthlyMobileQcCnt', 'monthlyAvePcClkCnt', 'monthlyAveMobileClkCnt', 'plAvgDepth']
+CTR_FIELDS = ['monthlyAvePcCtr', 'monthlyAveMobileCtr']
+
+# 두 파서가 같은 값으로 해석해야 하는 입력
+SAME_VALUES = [0, 7, "7", "< 10", "-", "", None, 12.7, 0.0, "abc", " 12 "]
+SAME_COMP_IDX = ['낮음', '보통', '높음', 'N/A', None, 10, "10", 55.5, "85", "알수없음"]
+
+def item(**fields):
+    return dict({'relKeyword': "키워드", 'compIdx': '보통'}, **fields)
+
+def assert_same(keyword_list):
+    assert parse_detailed_keyword_list(keyword_list) == parse_items_legacy(keyword_list)
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_legacy_on_generated_responses(seed):
+    assert_same(make_keyword_list(500, seed))
+
+@pytest.mark.parametrize("field", STAT_FIELDS + CTR_FIELDS)
+@pytest.mark.parametrize("value", SAME_VALUES)
+def test_matches_legacy_on_edge_values(field, value):
+    assert_same([item(**{field: value})])
+
+@pytest.mark.parametrize("value", SAME_COMP_IDX)
+def test_matches_legacy_on_competition_index(value):
+    assert_same([item(compIdx=value)])
+
+def test_matches_legacy_on_missing_fields_and_blank_keywords():
+    assert_same([{'relKeyword': "키워드"}, {'relKeyword': "  "}, {'relKeyword': ""}])
+    assert_same([item(monthlyAvePcCtr=-1.0, monthlyAveMobileCtr=0.0)])
+
+@pytest.mark.parametrize("value, legacy, parsed", [
+    ("1.5", 0, 1),    # 항목별 파서는 int("1.5") 실패로 0
+    ("1e3", 0, 1000),
+    (-3, -3, 0),      # 음수는 0으로 제한
+    ("-3", 0, 0),
+])
+def test_documented_differences_from_legacy(value, legacy, parsed):
+    keyword_list = [item(monthlyPcQcCnt=value)]
+    assert parse_items_legacy(keyword_list)[0]['monthly_pc_search'] == legacy
+    assert parse_detailed_keyword_list(keyword_list)[0]['monthly_pc_search'] == parsed
+
+def test_null_keyword_is_skipped():
+    assert parse_detailed_keyword_list([{'relKeyword': None}, item()])[0]['keyword'] == "키워드"
+
+def test_frame_matches_records():
+    keyword_list = make_keyword_list(200, 7)
+    frame = parse_keyword_list_frame(keyword_list)
+    records = parse_detailed_keyword_list(keyword_list)
+    assert frame['keyword'].tolist() == [r['keyword'] for r in records]
+    assert frame['total_monthly_search'].tolist() == [r['total_monthly_search'] for r in records]
+    assert frame['competition_level'].astype(str).tolist() == [r['competition_level'] for r in records]
+    assert frame['total_monthly_avg_ctr'].tolist() == pytest.approx([r['total_monthly_avg_ctr'] for r in records])
@@ -0,0 +1,52 @@
+"""
+묶음 키워드 통계 조회(keyword_stats_batch) 캐시 테스트
+가짜 keyword_list로 응답을 구성하고 시드별 캐시 재사용과 실제 조회 횟수를 확인
+"""
+
+import pytest
+import ads_client
+from cache import keyword_stats_cache
+
+def row(keyword, pc=100):
+    return {'relKeyword': keyword, 'monthlyPcQcCnt': pc, 'monthlyMobileQcCnt': pc, 'compIdx': '보통'}
+
+@pytest.fixture
+def client(monkeypatch):
+    """응답 표에 있는 시드만 행을 돌려주는 가짜 keyword_list를 가진 클라이언트"""
+    keyword_stats_cache.clear()
+    client = ads_client.SearchAdsClient()
+    client.requests = []
+    known = {"캠핑의자": [row("캠핑의자"), row("캠핑테이블", 50)], "텐트": [row("텐트")]}
+    
+    def keyword_list(hint_keywords):
+        client.requests.append(hint_keywords)
+        return [r for seed in hint_keywords.split(",") for r in known.get(seed, [])]
+    
+    monkeypatch.setattr(client, "keyword_list", keyword_list)
+    return client
+
+def test_seed_rows_are_cached_per_seed(client):
+    first = client.keyword_stats_batch(["캠핑의자", "텐트"])
+    assert first['seeds']["텐트"]['keyword'] == "텐트"
+    second = client.keyword_stats_batch(["텐트", "캠핑의자"])
+    assert client.requests == ["캠핑의자,텐트"]
+    assert second['seeds']["캠핑의자"]['total_monthly_search'] == 200
+
+def test_missing_seed_is_cached_as_negative_entry(client):
+    first = client.keyword_stats_batch(["캠핑의자", "없는키워드"])
+    assert first['seeds']["없는키워드"] is None
+    second = client.keyword_stats_batch(["없는키워드", "텐트"])
+    # 행이 없던 시드는 다시 조회하지 않고 텐트만 조회
+    assert client.requests == ["캠핑의자,없는키워드", "텐트"]
+    assert second['seeds']["없는키워드"] is None
+    assert second['seeds']["텐트"]['keyword'] == "텐트"
+
+def test_empty_single_seed_result_is_cached(client):
+    client.keyword_stats_batch(["없는키워드"])
+    client.keyword_stats_batch(["없는키워드"])
+    assert client.requests == ["없는키워드"]
+
+def test_refresh_ignores_negative_entry(client):
+    client.keyword_stats_batch(["캠핑의자", "없는키워드"])
+    client.keyword_stats_batch(["없는키워드"], refresh=True)
+    assert client.requests == ["캠핑의자,없는키워드", "없는키워드"]
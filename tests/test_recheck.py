@@ -0,0 +1,127 @@
+"""
+증분 순위 재확인(recheck_top_ranked_product) 동작 테스트
+가짜 fetch_shopping_page로 검색 결과를 구성하고 조회한 페이지와 반환값을 확인
+"""
+
+import pytest
+import api
+
+MALL = "쿠팡"
+
+class FakeSerp:
+    """{순위: 상품ID} 위치에만 판매처 상품이 있는 가짜 검색 결과 (나머지는 다른 판매처)"""
+    
+    def __init__(self, mall_products: dict, total: int = 1000):
+        self.mall_products = mall_products
+        self.total = total
+        self.calls = []
+    
+    def fetch(self, keyword, start, display=100, retry_budget=None):
+        self.calls.append(start)
+        items = []
+        for rank in range(start, min(start + display, self.total + 1)):
+            product_id = self.mall_products.get(rank)
+            items.append({
+                "mallName": MALL if product_id else "다른판매처",
+                "productId": product_id or f"other-{rank}",
+                "title": f"상품 {rank}",
+                "lprice": "10000",
+                "link": "https://example.com",
+            })
+        return items
+
+@pytest.fixture
+def serp(monkeypatch):
+    """FakeSerp를 만들어 api.fetch_shopping_page를 대체하는 팩토리"""
+    def make(mall_products: dict, total: int = 1000) -> FakeSerp:
+        fake = FakeSerp(mall_products, total)
+        monkeypatch.setattr(api, "fetch_shopping_page", fake.fetch)
+        return fake
+    return make
+
+def recheck(last_rank=None, product_id="T", prove_best=False):
+    last_known = {'rank': last_rank, 'productId': product_id} if last_rank else None
+    return api.recheck_top_ranked_product("키워드", MALL, last_known, prove_best=prove_best, raise_errors=True)
+
+def test_page_order_widens_around_last_rank():
+    assert api._recheck_page_order(250, 10) == [2, 1, 3, 0, 4, 5, 6, 7, 8, 9]
+    assert api._recheck_page_order(1, 10) == list(range(10))
+    assert api._recheck_page_order(1000, 10) == list(range(9, -1, -1))
+    # 범위를 벗어난 이전 순위는 마지막 페이지로 제한
+    assert api._recheck_page_order(5000, 3) == [2, 1, 0]
+
+def test_found_on_first_page_is_proven(serp):
+    fake = serp({40: "T"})
+    result = recheck(last_rank=50)
+    assert (result['rank'], result['productId'], result['proven']) == (40, "T", True)
+    assert fake.calls == [1]
+
+def test_found_on_probe_page_without_earlier_pages_is_unproven(serp):
+    fake = serp({240: "T"})
+    result = recheck(last_rank=250)
+    assert (result['rank'], result['proven']) == (240, False)
+    assert fake.calls == [201]
+
+def test_moved_earlier_returns_best_from_probed_pages(serp):
+    fake = serp({130: "T", 220: "B"})
+    result = recheck(last_rank=250)
+    # 201 페이지에는 추적 상품이 없어 101 페이지까지 탐색, 1 페이지는 건너뜀
+    assert (result['rank'], result['productId'], result['proven']) == (130, "T", False)
+    assert fake.calls == [201, 101]
+
+def test_earlier_probed_page_with_other_mall_product_wins(serp):
+    fake = serp({150: "A", 350: "T"})
+    result = recheck(last_rank=250)
+    # 301 페이지에서 추적 상품을 찾은 뒤, 이미 조회한 101 페이지의 더 높은 순위를 반환
+    assert (result['rank'], result['productId'], result['proven']) == (150, "A", False)
+    assert fake.calls == [201, 101, 301]
+
+def test_unchanged_rank_with_skipped_earlier_pages_is_unproven(serp):
+    fake = serp({150: "A", 350: "T"})
+    result = recheck(last_rank=350)
+    # 앞 페이지를 보지 않았으므로 판매처 최고 순위(150)가 아닐 수 있음 → 미확정
+    assert (result['rank'], result['productId'], result['proven']) == (350, "T", False)
+    assert fake.calls == [301]
+
+def test_moved_later_with_skipped_earlier_page_is_unproven(serp):
+    fake = serp({150: "A", 420: "T"})
+    result = recheck(last_rank=350)
+    assert (result['rank'], result['productId'], result['proven']) == (420, "T", False)
+    assert fake.calls == [301, 201, 401]
+
+def test_gone_product_falls_back_to_ascending_scan(serp):
+    fake = serp({150: "A"})
+    result = recheck(last_rank=250)
+    assert (result['rank'], result['productId'], result['proven']) == (150, "A", True)
+    # 탐색한 페이지는 다시 요청하지 않음
+    assert fake.calls == [201, 101, 301, 1]
+
+def test_gone_mall_scans_every_page_once(serp):
+    fake = serp({})
+    assert recheck(last_rank=250) is None
+    assert sorted(fake.calls) == list(range(1, 1001, 100))
+    assert len(fake.calls) == len(set(fake.calls))
+
+def test_fallback_scan_stops_at_short_last_page(serp):
+    fake = serp({}, total=150)
+    assert recheck(last_rank=50) is None
+    assert fake.calls == [1, 101]
+
+def test_prove_best_scans_from_first_page(serp):
+    fake = serp({150: "A", 350: "T"})
+    result = recheck(last_rank=250, prove_best=True)
+    assert (result['rank'], result['productId'], result['proven']) == (150, "A", True)
+    assert fake.calls == [1, 101]
+
+def test_without_last_rank_scans_from_first_page(serp):
+    fake = serp({350: "T"})
+    result = recheck()
+    assert (result['rank'], result['proven']) == (350, True)
+    assert fake.calls == [1, 101, 201, 301]
+
+def test_probe_skips_pages_after_short_page(serp):
+    fake = serp({150: "A"}, total=320)
+    result = recheck(last_rank=350)
+    assert (result['rank'], result['proven']) == (150, True)
+    # 301 페이지가 마지막 페이지이므로 401 페이지는 조회하지 않음
+    assert fake.calls == [301, 201, 1, 101]
@@ -0,0 +1,181 @@
+"""
+Rank tracker module for the marketing tool
+관심 키워드(키워드, 판매처) 목록을 주기적으로 재확인하는 백그라운드 추적기
+
+Streamlit과 별도 프로세스로 실행:
+    python tracker.py add "무선 마우스" 쿠팡 --interval 120
+    python tracker.py list
+    python tracker.py run
+"""
+
+import argparse
+import logging
+import os
+import time
+from api import get_top_ranked_product_by_mall, recheck_top_ranked_product
+from config import StorageConfig, TrackerConfig
+from history import rank_history
+from scheduler import run_keyword_tasks
+from sqlite_store import SQLiteStore
+
+logger = logging.getLogger("tracker")
+
+class WatchlistStore(SQLiteStore):
+    """재확인 주기와 마지막 확인 시각을 가진 (키워드, 판매처) 관심 목록"""
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS watchlist (
+            keyword TEXT NOT NULL,
+            mall_name TEXT NOT NULL,
+            interval_minutes INTEGER NOT NULL,
+            last_checked_at REAL,
+            created_at REAL NOT NULL,
+            last_full_scan_at REAL,
+            PRIMARY KEY (keyword, mall_name)
+        );
+    """
+    
+    def add(self, keyword: str, mall_name: str, interval_minutes: int = None):
+        """관심 목록에 추가 (이미 있으면 주기만 변경)"""
+        interval = interval_minutes or TrackerConfig.DEFAULT_INTERVAL_MINUTES
+        with self._lock:
+            self._connect().execute(
+                "INSERT INTO watchlist (keyword, mall_name, interval_minutes, created_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (keyword, mall_name) DO UPDATE SET interval_minutes = excluded.interval_minutes",
+                (keyword, mall_name, interval, time.time())
+            )
+    
+    def remove(self, keyword: str, mall_name: str):
+        """관심 목록에서 제거"""
+        with self._lock:
+            self._connect().execute("DELETE FROM watchlist WHERE keyword = ? AND mall_name = ?", (keyword, mall_name))
+    
+    def items(self) -> list:
+        """전체 관심 목록 [{keyword, mall_name, interval_minutes, last_checked_at}, ...]"""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT keyword, mall_name, interval_minutes, last_checked_at FROM watchlist ORDER BY created_at"
+            ).fetchall()
+        return [
+            {'keyword': r[0], 'mall_name': r[1], 'interval_minutes': r[2], 'last_checked_at': r[3]}
+            for r in rows
+        ]
+    
+    def due(self, now: float = None) -> list:
+        """재확인 주기가 지난 (키워드, 판매처명, 마지막 전체 스캔 시각) 목록"""
+        now = now or time.time()
+        with self._lock:
+            return self._connect().execute(
+                "SELECT keyword, mall_name, last_full_scan_at FROM watchlist "
+                "WHERE last_checked_at IS NULL OR last_checked_at + interval_minutes * 60 <= ?",
+                (now,)
+            ).fetchall()
+    
+    def mark_checked(self, keyword: str, mall_name: str, checked_at: float = None, full_scan: bool = False):
+        """마지막 확인 시각 갱신 (최고 순위를 확정한 전체 스캔이면 전체 스캔 시각도 갱신)"""
+        checked_at = checked_at or time.time()
+        with self._lock:
+            self._connect().execute(
+                "UPDATE watchlist SET last_checked_at = ?, "
+                "last_full_scan_at = CASE WHEN ? THEN ? ELSE last_full_scan_at END "
+                "WHERE keyword = ? AND mall_name = ?",
+                (checked_at, full_scan, checked_at, keyword, mall_name)
+            )
+
+# 관심 목록 기본 저장소
+watchlist = WatchlistStore(os.path.join(StorageConfig.DATA_DIR, "watchlist.sqlite3"))
+
+def check_pair(pair: tuple):
+    """(키워드, 판매처명, 마지막 전체 스캔 시각) 하나의 순위 확인 - 오류는 호출자에게 전달
+
+    이전 결과가 있으면 그 위치부터 증분 재확인하고, 마지막 전체 스캔이
+    FULL_RESCAN_HOURS보다 오래되었으면 최고 순위를 확정하는 스캔을 한다.
+    반환값의 'proven'은 판매처 최고 순위가 확정되었는지 여부다.
+    """
+    keyword, mall_name, last_full_scan_at = pair
+    if not TrackerConfig.INCREMENTAL_RECHECK:
+        product = get_top_ranked_product_by_mall(keyword, mall_name, raise_errors=True)
+        return dict(product, proven=True) if product else None
+    
+    full_scan_due = (
+        last_full_scan_at is None
+        or time.time() - last_full_scan_at >= TrackerConfig.FULL_RESCAN_HOURS * 60 * 60
+    )
+    return recheck_top_ranked_product(
+        keyword, mall_name, rank_history.last_result(keyword, mall_name),
+        prove_best=full_scan_due, raise_errors=True
+    )
+
+def run_due_checks() -> int:
+    """주기가 지난 관심 키워드를 동시에 재확인하고 이력에 저장, 처리한 개수 반환"""
+    due_pairs = watchlist.due()
+    if not due_pairs:
+        return 0
+    
+    logger.info("재확인 대상 %d개", len(due_pairs))
+    for (keyword, mall_name, _), product, error in run_keyword_tasks(due_pairs, check_pair):
+        if error:
+            # 실패한 항목은 이력에 남기지 않고 다음 주기에 다시 시도
+            logger.warning("'%s' / '%s' 확인 실패: %s", keyword, mall_name, error)
+            continue
+        checked_at = time.time()
+        # 순위권 밖(None)은 전체 페이지를 확인한 결과이므로 확정된 것으로 봄
+        # (미확정 순위는 이력에도 proven=0으로 기록되어 화면에서 구분됨)
+        proven = product['proven'] if product else True
+        rank_history.record(keyword, mall_name, product, checked_at=checked_at)
+        watchlist.mark_checked(keyword, mall_name, checked_at=checked_at, full_scan=proven)
+        logger.info("'%s' / '%s' → %s%s", keyword, mall_name,
+                    f"{product['rank']}위" if product else "순위권 밖", "" if proven else " (증분)")
+    return len(due_pairs)
+
+def run_forever(poll_seconds: float = None):
+    """Streamlit 재실행과 무관하게 관심 목록을 계속 재확인"""
+    poll_seconds = poll_seconds or TrackerConfig.POLL_SECONDS
+    logger.info("순위 추적기 시작 (확인 주기 %s초)", poll_seconds)
+    while True:
+        try:
+            run_due_checks()
+        except Exception:
+            logger.exception("재확인 중 오류")
+        time.sleep(poll_seconds)
+
+def main():
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description="관심 키워드 순위 추적기")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    add_parser = subparsers.add_parser("add", help="관심 키워드 추가")
+    add_parser.add_argument("keyword")
+    add_parser.add_argument("mall_name")
+    add_parser.add_argument("--interval", type=int, default=TrackerConfig.DEFAULT_INTERVAL_MINUTES, help="재확인 주기 (분)")
+    
+    remove_parser = subparsers.add_parser("remove", help="관심 키워드 제거")
+    remove_parser.add_argument("keyword")
+    remove_parser.add_argument("mall_name")
+    
+    subparsers.add_parser("list", help="관심 키워드 목록")
+    subparsers.add_parser("once", help="재확인 대상을 한 번만 처리")
+    
+    run_parser = subparsers.add_parser("run", help="계속 실행하며 주기적으로 재확인")
+    run_parser.add_argument("--poll", type=float, default=TrackerConfig.POLL_SECONDS, help="재확인 대상 확인 주기 (초)")
+    
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    
+    if args.command == "add":
+        watchlist.add(args.keyword, args.mall_name, args.interval)
+        print(f"추가됨: {args.keyword} / {args.mall_name} ({args.interval}분 주기)")
+    elif args.command == "remove":
+        watchlist.remove(args.keyword, args.mall_name)
+        print(f"제거됨: {args.keyword} / {args.mall_name}")
+    elif args.command == "list":
+        for item in watchlist.items():
+            last = time.strftime("%Y-%m-%d %H:%M", time.localtime(item['last_checked_at'])) if item['last_checked_at'] else "-"
+            print(f"{item['keyword']}\t{item['mall_name']}\t{item['interval_minutes']}분\t마지막 확인: {last}")
+    elif args.command == "once":
+        print(f"{run_due_checks()}개 재확인 완료")
+    else:
+        run_forever(args.poll)
+
+if __name__ == "__main__":
+    main()
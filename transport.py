@@ -0,0 +1,222 @@
+"""
+HTTP transport module for the marketing tool
+호스트별 keep-alive 연결 풀을 사용하는 공용 HTTP 요청 경로
+"""
+
+import email.utils
+import gzip
+import http.client
+import random
+import threading
+import time
+import urllib.parse
+from config import NetworkConfig
+from runtime_config import runtime_config
+
+class HTTPStatusError(Exception):
+    """HTTP 4xx/5xx 응답 오류"""
+    
+    def __init__(self, status: int, reason: str, headers: dict, body: bytes = b""):
+        super().__init__(f"HTTP Error {status}: {reason}")
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+# 재사용하던 연결이 서버 쪽에서 끊어진 경우 (새 연결로 한 번 재시도)
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+class RetryBudget:
+    """작업 하나(예: 키워드 하나)가 사용할 수 있는 총 재시도 횟수"""
+    
+    def __init__(self, retries: int = None):
+        self.remaining = NetworkConfig.RETRY_BUDGET_PER_KEYWORD if retries is None else retries
+        self._lock = threading.Lock()
+    
+    def spend(self) -> bool:
+        """재시도 1회를 차감 (남은 횟수가 없으면 False)"""
+        with self._lock:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            return True
+
+class RetryPolicy:
+    """멱등 GET 요청의 재시도 정책 - 지터가 적용된 지수 백오프와 Retry-After 헤더 준수"""
+    
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    
+    def __init__(self, max_attempts: int = None, base_delay: float = None, max_delay: float = None):
+        self.max_attempts = max_attempts or NetworkConfig.RETRY_MAX_ATTEMPTS
+        self.base_delay = base_delay or NetworkConfig.RETRY_BASE_DELAY
+        self.max_delay = max_delay or NetworkConfig.RETRY_MAX_DELAY
+    
+    def is_retryable(self, error: Exception) -> bool:
+        """일시적인 오류인지 확인 (429/5xx, 연결/타임아웃 오류)"""
+        if isinstance(error, HTTPStatusError):
+            return error.status in self.RETRY_STATUSES
+        return isinstance(error, (OSError, http.client.HTTPException))
+    
+    def delay(self, error: Exception, attempt: int) -> float:
+        """attempt번째 재시도 전 대기 시간 (Full Jitter 백오프, Retry-After가 더 길면 그 값)"""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        if isinstance(error, HTTPStatusError):
+            retry_after = _parse_retry_after(error.headers)
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, NetworkConfig.RETRY_AFTER_MAX))
+        return delay
+
+def _parse_retry_after(headers: dict):
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환"""
+    value = next((v for k, v in headers.items() if k.lower() == "retry-after"), None)
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class HTTPTransport:
+    """호스트별 지속 연결 풀, gzip 응답 압축, 연결/읽기 타임아웃을 지원하는 HTTP 클라이언트
+
+    타임아웃을 지정하지 않으면 요청마다 실행 중 설정(api_timeout)을 읽으므로
+    설정 페이지에서 바꾼 값이 재시작 없이 바로 적용된다.
+    """
+    
+    def __init__(self, connect_timeout: float = None, read_timeout: float = None, max_idle_per_host: int = None,
+                 retry_policy: RetryPolicy = None):
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self.max_idle_per_host = max_idle_per_host or NetworkConfig.MAX_IDLE_CONNECTIONS_PER_HOST
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._idle = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def read_timeout(self) -> float:
+        """응답 읽기 타임아웃 (초)"""
+        return self._read_timeout or runtime_config.get('api_timeout')
+    
+    @property
+    def connect_timeout(self) -> float:
+        """연결 타임아웃 (초) - 읽기 타임아웃보다 길지 않게 제한"""
+        return self._connect_timeout or min(NetworkConfig.CONNECT_TIMEOUT, self.read_timeout)
+    
+    def _new_connection(self, scheme: str, host: str, port: int):
+        """새 연결 생성 - 연결 타임아웃으로 접속한 뒤 읽기 타임아웃으로 전환"""
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=self.connect_timeout)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=self.connect_timeout)
+        conn.connect()
+        conn.sock.settimeout(self.read_timeout)
+        return conn
+    
+    def _checkout(self, key: tuple):
+        """풀에서 유휴 연결을 꺼냄 (없으면 None)"""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop()
+        return None
+    
+    def _checkin(self, key: tuple, conn):
+        """사용이 끝난 연결을 풀에 반환 (풀이 가득 차면 닫음)"""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+    
+    def get(self, url: str, headers: dict = None, limiter=None, retry_budget: RetryBudget = None) -> bytes:
+        """GET 요청을 보내고 (압축 해제된) 응답 본문을 반환
+
+        일시적인 오류는 재시도 정책에 따라 다시 요청하며, limiter가 주어지면
+        재시도를 포함한 매 요청 전에 속도 제한/일일 한도를 적용한다.
+        retry_budget이 주어지면 재시도마다 차감하고, 소진되면 오류를 그대로 올린다.
+        """
+        attempt = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                return self._get_once(url, headers)
+            except Exception as e:
+                if attempt + 1 >= self.retry_policy.max_attempts or not self.retry_policy.is_retryable(e):
+                    raise
+                if retry_budget is not None and not retry_budget.spend():
+                    raise
+                time.sleep(self.retry_policy.delay(e, attempt))
+                attempt += 1
+    
+    def _get_once(self, url: str, headers: dict = None) -> bytes:
+        """재시도 없이 GET 요청 한 번 실행"""
+        parsed = urllib.parse.urlsplit(url)
+        scheme = parsed.scheme or "https"
+        port = parsed.port or (443 if scheme == "https" else 80)
+        key = (scheme, parsed.hostname, port)
+        path = parsed.path or "/"
+        if parsed.query:
+            path = f"{path}?{parsed.query}"
+        
+        request_headers = {"Accept-Encoding": "gzip", "Connection": "keep-alive"}
+        if headers:
+            request_headers.update(headers)
+        
+        conn = self._checkout(key)
+        reused = conn is not None
+        while True:
+            if conn is None:
+                conn = self._new_connection(scheme, parsed.hostname, port)
+            else:
+                # 재사용 연결에도 현재 설정의 읽기 타임아웃 적용
+                conn.sock.settimeout(self.read_timeout)
+            try:
+                conn.request("GET", path, headers=request_headers)
+                response = conn.getresponse()
+                body = response.read()
+                break
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                # 끊어진 유휴 연결이었으면 새 연결로 다시 시도
+                conn, reused = None, False
+            except Exception:
+                conn.close()
+                raise
+        
+        if response.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+        
+        if response.getheader("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        
+        if response.status >= 400:
+            raise HTTPStatusError(response.status, response.reason, dict(response.getheaders()), body)
+        
+        return body
+    
+    def close(self):
+        """풀에 있는 모든 연결 종료"""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+# 모든 네이버 API 호출이 공유하는 기본 전송 계층
+default_transport = HTTPTransport()